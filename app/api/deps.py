@@ -1,17 +1,9 @@
 # app/api/deps.py
-from typing import AsyncGenerator
-
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.core.db import get_db
 from app.core.security import get_current_user
 from app.api.v1.auth.schemas import UserOut
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
-
 
 async def get_current_active_user(
     current_user: UserOut = Depends(get_current_user),
@@ -39,8 +31,3 @@ async def get_current_superuser(
             detail="Not a superuser",
         )
     return current_user
-
-
-
-
-
@@ -5,6 +5,8 @@ from fastapi import APIRouter
 from app.api.v1.items import router as items_router
 from app.api.v1.auth import router as auth_router
 
+# Routes keep FastAPI's default response class, so response_model routes
+# are serialized straight to JSON bytes by pydantic-core
 api_router = APIRouter()
 
 api_router.include_router(auth_router.router, prefix="/auth", tags=["auth"])
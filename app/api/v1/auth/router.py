@@ -1,26 +1,36 @@
 
 # app/api/v1/auth/router.py
 from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_current_superuser
 from app.api.v1.auth.schemas import LoginRequest, Token, UserCreate, UserOut, UserUpdate
 from app.api.v1.auth.service import user_service
-from app.core.db import get_db
+from app.core.db import get_db, get_db_deferred_commit
 from app.services.ratelimit import rate_limit
+from app.utils.common import is_not_modified, pydantic_response, weak_etag
 
 router = APIRouter()
 
+# Both login routes draw from one stricter bucket, on top of the default
+# limit applied by RateLimitMiddleware
+login_rate_limit = rate_limit(
+    requests=10,
+    window_seconds=60,
+    redis_prefix="ratelimit:login:",
+)
+
 
 @router.post(
     "/register",
     response_model=UserOut,
     status_code=status.HTTP_201_CREATED,
     summary="Register new user",
-    dependencies=[Depends(rate_limit())],
 )
 async def register_user(
     user_in: UserCreate,
@@ -34,25 +44,19 @@ async def register_user(
     - **password**: User's password (min 8 characters)
     - **full_name**: Optional full name
     """
-    # Check if user already exists
-    existing_user = await user_service.get_by_email_or_username(
-        db,
-        email=user_in.email,
-        username=user_in.username,
-    )
+    # Create new user (without superuser privileges). model_copy keeps the
+    # already-validated fields instead of dumping and re-validating them.
+    user_in = user_in.model_copy(update={"is_superuser": False})
     
-    if existing_user:
+    user = await user_service.create(db, obj_in=user_in)
+    
+    # create() returns None when the email or username is already taken
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered",
         )
     
-    # Create new user (without superuser privileges)
-    user_data = user_in.model_dump()
-    user_data["is_superuser"] = False  # Ensure no one can register as superuser
-    
-    user = await user_service.create(db, obj_in=UserCreate(**user_data))
-    
     return user
 
 
@@ -60,12 +64,12 @@ async def register_user(
     "/login",
     response_model=Token,
     summary="Login user",
-    dependencies=[Depends(rate_limit(requests=10, window_seconds=60))],
+    dependencies=[Depends(login_rate_limit)],
 )
 async def login(
     login_in: LoginRequest,
     db: AsyncSession = Depends(get_db),
-) -> Token:
+) -> ORJSONResponse:
     """
     Login to get access token.
     
@@ -91,22 +95,23 @@ async def login(
             detail="Inactive user",
         )
     
-    # Create access token
+    # Create access token; the dict already matches Token, so it is
+    # encoded directly instead of being validated through the model
     token_data = user_service.create_token(user.id)
     
-    return Token(**token_data)
+    return ORJSONResponse(token_data)
 
 
 @router.post(
     "/login/token",
     response_model=Token,
     summary="OAuth2 compatible token login",
-    dependencies=[Depends(rate_limit(requests=10, window_seconds=60))],
+    dependencies=[Depends(login_rate_limit)],
 )
 async def login_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db),
-) -> Token:
+) -> ORJSONResponse:
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
@@ -129,36 +134,57 @@ async def login_token(
             detail="Inactive user",
         )
     
-    # Create access token
+    # Create access token; the dict already matches Token, so it is
+    # encoded directly instead of being validated through the model
     token_data = user_service.create_token(user.id)
     
-    return Token(**token_data)
+    return ORJSONResponse(token_data)
 
 
 @router.get(
     "/me",
     response_model=UserOut,
     summary="Get current user",
-    dependencies=[Depends(rate_limit())],
 )
 async def get_me(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: UserOut = Depends(get_current_active_user),
-) -> UserOut:
+) -> Response:
     """
     Get current user.
+    
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
     """
-    return current_user
+    # The token only carries the user's ID; the ETag needs the row's
+    # last update time
+    db_user = await user_service.get(db, id=UUID(current_user.id))
+    
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    
+    etag = weak_etag(db_user.id, db_user.updated_at)
+    
+    if is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    
+    # Rows were validated on the way in; skip the response_model pass
+    return pydantic_response(UserOut.from_trusted(db_user), headers={"ETag": etag})
 
 
 @router.put(
     "/me",
     response_model=UserOut,
     summary="Update current user",
-    dependencies=[Depends(rate_limit())],
 )
 async def update_me(
     user_in: UserUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_deferred_commit),
     current_user: UserOut = Depends(get_current_active_user),
 ) -> UserOut:
     """
@@ -170,7 +196,7 @@ async def update_me(
     - **full_name**: Optional new full name
     """
     # Get current user from database
-    db_user = await user_service.get(db, id=current_user.id)
+    db_user = await user_service.get(db, id=UUID(current_user.id))
     
     if not db_user:
         raise HTTPException(
@@ -180,24 +206,20 @@ async def update_me(
     
     # Check if email or username already exists
     if user_in.email and user_in.email != db_user.email:
-        existing_user = await user_service.get_by_email_or_username(
+        if await user_service.exists_by_email_or_username(
             db,
             email=user_in.email,
-        )
-        
-        if existing_user:
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
     
     if user_in.username and user_in.username != db_user.username:
-        existing_user = await user_service.get_by_email_or_username(
+        if await user_service.exists_by_email_or_username(
             db,
             username=user_in.username,
-        )
-        
-        if existing_user:
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered",
@@ -208,11 +230,16 @@ async def update_me(
     if "is_superuser" in user_data:
         del user_data["is_superuser"]
     
+    # Credential changes are committed before responding; cosmetic changes
+    # are flushed and committed by the session dependency after the response
+    critical_changes = user_data.keys() & {"email", "username", "password"}
+    
     # Update user
     user = await user_service.update(
         db,
         db_obj=db_user,
         obj_in=user_data,
+        commit=bool(critical_changes),
     )
     
     return user
@@ -222,16 +249,13 @@ async def update_me(
     "/users",
     response_model=list[UserOut],
     summary="Get all users",
-    dependencies=[
-        Depends(get_current_superuser),
-        Depends(rate_limit()),
-    ],
+    dependencies=[Depends(get_current_superuser)],
 )
 async def get_users(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-) -> list[UserOut]:
+) -> ORJSONResponse:
     """
     Get all users. Requires superuser privileges.
     
@@ -239,4 +263,8 @@ async def get_users(
     - **limit**: Maximum number of users to return
     """
     users = await user_service.get_multi(db, skip=skip, limit=limit)
-    return users
+    
+    # Serialize trusted rows directly instead of validating each one
+    return ORJSONResponse(
+        [UserOut.from_trusted(user).model_dump(mode="json") for user in users]
+    )
@@ -1,7 +1,7 @@
 
 # app/api/v1/auth/schemas.py
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -47,6 +47,24 @@ class UserOut(UserBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_trusted(cls, user: Any) -> "UserOut":
+        """
+        Build from a database row without running validation.
+        
+        Rows were validated on the way in, so the validators are skipped.
+        """
+        return cls.model_construct(
+            id=str(user.id),
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
 
 class UserInDB(UserBase):
     """
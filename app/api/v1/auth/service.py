@@ -1,17 +1,26 @@
 
 # app/api/v1/auth/service.py
+import asyncio
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import or_, select
+from sqlalchemy import Select, exists, lambda_stmt, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.api.v1.auth.models import User
 from app.api.v1.auth.schemas import UserCreate, UserInDB, UserUpdate
-from app.core.config import settings
-from app.core.security import create_access_token, create_password_hash, verify_password
+from app.core.config import DatabaseType, settings
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    create_password_hash,
+    verify_password,
+    verify_password_cached,
+)
 from app.db.base import CRUDBase
 
 
@@ -33,49 +42,118 @@ class UserService(CRUDBase[User, UserCreate, UserUpdate]):
         if not email and not username:
             return None
         
-        query = select(User)
-        
+        # Lambda statements are compiled once per branch and cached; the
+        # closure variables become bound parameters on each call
         if email and username:
-            query = query.where(or_(User.email == email, User.username == username))
+            query = lambda_stmt(
+                lambda: select(User).where(
+                    or_(User.email == email, User.username == username)
+                )
+            )
         elif email:
-            query = query.where(User.email == email)
+            query = lambda_stmt(lambda: select(User).where(User.email == email))
         else:
-            query = query.where(User.username == username)
+            query = lambda_stmt(lambda: select(User).where(User.username == username))
         
         result = await db.execute(query)
         return result.scalars().first()
     
-    async def create(
+    async def exists_by_email_or_username(
         self,
         db: AsyncSession,
         *,
-        obj_in: UserCreate,
-    ) -> User:
+        email: Optional[str] = None,
+        username: Optional[str] = None,
+    ) -> bool:
         """
-        Create a new User.
+        Check if a User with the given email or username exists.
         """
-        # Check if user already exists
-        existing_user = await self.get_by_email_or_username(
-            db,
-            email=obj_in.email,
-            username=obj_in.username,
-        )
+        if not email and not username:
+            return False
         
-        if existing_user:
-            return None
+        if email and username:
+            condition = or_(User.email == email, User.username == username)
+        elif email:
+            condition = User.email == email
+        else:
+            condition = User.username == username
+        
+        result = await db.execute(select(exists().where(condition)))
+        return result.scalar_one()
+    
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        query: Optional[Select] = None,
+    ) -> List[User]:
+        """
+        Get multiple Users, loading only the columns exposed by UserOut.
+        """
+        if query is None:
+            query = select(User)
         
-        # Create new user
-        db_obj = User(
-            username=obj_in.username,
-            email=obj_in.email,
-            full_name=obj_in.full_name,
-            hashed_password=create_password_hash(obj_in.password),
-            is_active=obj_in.is_active,
-            is_superuser=obj_in.is_superuser,
+        query = query.options(
+            load_only(
+                User.id,
+                User.email,
+                User.username,
+                User.full_name,
+                User.is_active,
+                User.is_superuser,
+                User.created_at,
+                User.updated_at,
+            )
         )
         
+        return await super().get_multi(db, skip=skip, limit=limit, query=query)
+    
+    async def create(  # type: ignore[override]
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: UserCreate,
+    ) -> Optional[User]:
+        """
+        Create a new User.
+        
+        Returns None if the email or username is already taken.
+        """
+        values = {
+            "username": obj_in.username,
+            "email": obj_in.email,
+            "full_name": obj_in.full_name,
+            "hashed_password": await asyncio.to_thread(
+                create_password_hash, obj_in.password
+            ),
+            "is_active": obj_in.is_active,
+            "is_superuser": obj_in.is_superuser,
+        }
+        
+        if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
+            # Let the unique indexes on email and username reject duplicates
+            query = (
+                pg_insert(User)
+                .values(**values)
+                .on_conflict_do_nothing()
+                .returning(User)
+            )
+            result = await db.execute(query)
+            db_obj = result.scalars().first()
+            await db.commit()
+            return db_obj
+        
+        db_obj = User(**values)
         db.add(db_obj)
-        await db.commit()
+        
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return None
+        
         await db.refresh(db_obj)
         
         return db_obj
@@ -86,6 +164,7 @@ class UserService(CRUDBase[User, UserCreate, UserUpdate]):
         *,
         db_obj: User,
         obj_in: Union[UserUpdate, Dict[str, Any]],
+        commit: bool = True,
     ) -> User:
         """
         Update a User.
@@ -96,11 +175,15 @@ class UserService(CRUDBase[User, UserCreate, UserUpdate]):
             update_data = obj_in.model_dump(exclude_unset=True)
         
         if update_data.get("password"):
-            hashed_password = create_password_hash(update_data["password"])
+            hashed_password = await asyncio.to_thread(
+                create_password_hash, update_data["password"]
+            )
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
         
-        return await super().update(db, db_obj=db_obj, obj_in=update_data)
+        return await super().update(
+            db, db_obj=db_obj, obj_in=update_data, commit=commit
+        )
     
     async def authenticate(
         self,
@@ -112,16 +195,19 @@ class UserService(CRUDBase[User, UserCreate, UserUpdate]):
         """
         Authenticate a User.
         """
-        user = await self.get_by_email_or_username(db, username=username)
+        # Match the identifier against both columns in a single query
+        user = await self.get_by_email_or_username(
+            db,
+            email=username,
+            username=username,
+        )
         
         if not user:
-            # Try with email
-            user = await self.get_by_email_or_username(db, email=username)
-            
-        if not user:
+            # Keep the response time of unknown identifiers in line with bad passwords
+            await asyncio.to_thread(verify_password, password, DUMMY_PASSWORD_HASH)
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_cached(password, user.hashed_password):
             return None
         
         return user
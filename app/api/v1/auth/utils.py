@@ -0,0 +1,69 @@
+# app/api/v1/auth/utils.py
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.auth.models import User
+from app.core.security import decode_access_token, verify_password
+
+
+async def check_user_exists(
+    db: AsyncSession,
+    user_id: UUID,
+) -> bool:
+    """
+    Check if a user exists.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user to check
+        
+    Returns:
+        True if the user exists, False otherwise
+    """
+    query = select(literal(1)).select_from(User).where(User.id == user_id).limit(1)
+    result = await db.execute(query)
+    return result.scalar() is not None
+
+
+async def validate_token(
+    token: str,
+) -> Optional[dict]:
+    """
+    Validate a JWT token.
+    
+    Args:
+        token: The token to validate
+        
+    Returns:
+        The token payload if valid, None otherwise
+    """
+    return decode_access_token(token)
+
+
+async def check_password(
+    db: AsyncSession,
+    user_id: UUID,
+    password: str,
+) -> bool:
+    """
+    Check if a password is correct for a user.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        password: Password to check
+        
+    Returns:
+        True if the password is correct, False otherwise
+    """
+    query = select(User).where(User.id == user_id)
+    result = await db.execute(query)
+    user = result.scalars().first()
+    
+    if not user:
+        return False
+    
+    return verify_password(password, user.hashed_password)
\ No newline at end of file
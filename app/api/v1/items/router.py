@@ -3,11 +3,22 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_current_superuser
 from app.api.v1.auth.schemas import UserOut
+from app.api.v1.items.models import Item
 from app.api.v1.items.schemas import (
     ItemCreate,
     ItemListResponse,
@@ -15,8 +26,15 @@ from app.api.v1.items.schemas import (
     ItemUpdate,
 )
 from app.api.v1.items.service import item_service
+from app.api.v1.items.utils import get_item_and_check_owner
 from app.core.db import get_db
-from app.services.ratelimit import rate_limit
+from app.services.cache import get_namespace_version
+from app.utils.common import (
+    is_not_modified,
+    pydantic_response,
+    stream_json_array,
+    weak_etag,
+)
 
 router = APIRouter()
 
@@ -25,35 +43,84 @@ router = APIRouter()
     "",
     response_model=ItemListResponse,
     summary="Get all items",
-    dependencies=[Depends(rate_limit())],
 )
 async def get_items(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     owner_id: Optional[UUID] = None,
-) -> ItemListResponse:
+) -> Response:
     """
     Get all items with pagination.
     
+    Answers 304 Not Modified, without querying the database, when
+    If-None-Match matches the current ETag. The ETag changes on every
+    item write.
+    
     - **skip**: Number of items to skip (for pagination)
     - **limit**: Maximum number of items to return
     - **owner_id**: Optional filter for items by owner
     """
-    items = await item_service.get_multi(
+    version = await get_namespace_version("items")
+    headers = None
+    
+    if version is not None:
+        etag = f'W/"{version}-{skip}-{limit}-{owner_id or ""}"'
+        if is_not_modified(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        headers = {"ETag": etag}
+    
+    items, total = await item_service.get_multi_with_count(
         db,
         skip=skip,
         limit=limit,
         owner_id=owner_id,
     )
-    total = await item_service.count(db, owner_id=owner_id)
     
-    return ItemListResponse(
-        items=items,
+    # Serialize trusted rows directly instead of validating each one
+    page = ItemListResponse.model_construct(
+        items=[ItemResponse.from_trusted(item) for item in items],
         total=total,
         skip=skip,
         limit=limit,
     )
+    
+    return pydantic_response(page, headers=headers)
+
+
+@router.get(
+    "/stream",
+    response_model=list[ItemResponse],
+    summary="Stream items",
+)
+async def stream_items(
+    db: AsyncSession = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    owner_id: Optional[UUID] = None,
+) -> StreamingResponse:
+    """
+    Stream items as a JSON array, uncached and without a total count.
+    
+    Rows are written out as the database returns them.
+    
+    - **skip**: Number of items to skip (for pagination)
+    - **limit**: Maximum number of items to return
+    - **owner_id**: Optional filter for items by owner
+    """
+    rows = item_service.get_multi_stream(
+        db,
+        skip=skip,
+        limit=limit,
+        whereclause=Item.owner_id == owner_id if owner_id else None,
+    )
+    
+    return StreamingResponse(
+        stream_json_array(rows), media_type="application/json"
+    )
 
 
 @router.post(
@@ -61,7 +128,6 @@ async def get_items(
     response_model=ItemResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create new item",
-    dependencies=[Depends(rate_limit())],
 )
 async def create_item(
     item_in: ItemCreate,
@@ -88,15 +154,17 @@ async def create_item(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Get item by ID",
-    dependencies=[Depends(rate_limit())],
 )
 async def get_item(
+    request: Request,
     item_id: UUID = Path(...),
     db: AsyncSession = Depends(get_db),
-) -> ItemResponse:
+) -> Response:
     """
     Get an item by ID.
     
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
+    
     - **item_id**: The ID of the item to retrieve
     """
     item = await item_service.get(db, id=item_id)
@@ -107,14 +175,21 @@ async def get_item(
             detail="Item not found",
         )
     
-    return item
+    etag = weak_etag(item.id, item.updated_at)
+    
+    if is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    
+    # Rows were validated on the way in; skip the response_model pass
+    return pydantic_response(ItemResponse.from_trusted(item), headers={"ETag": etag})
 
 
 @router.put(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Update item",
-    dependencies=[Depends(rate_limit())],
 )
 async def update_item(
     item_in: ItemUpdate,
@@ -131,7 +206,9 @@ async def update_item(
     - **price**: Optional new price (must be greater than 0)
     - **image_url**: Optional new URL to item image
     """
-    item = await item_service.get(db, id=item_id)
+    item, is_owner = await get_item_and_check_owner(
+        db, item_id, UUID(current_user.id)
+    )
     
     if not item:
         raise HTTPException(
@@ -140,7 +217,7 @@ async def update_item(
         )
     
     # Check ownership or superuser status
-    if item.owner_id != UUID(current_user.id) and not current_user.is_superuser:
+    if not is_owner and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
@@ -159,7 +236,6 @@ async def update_item(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Delete item",
-    dependencies=[Depends(rate_limit())],
 )
 async def delete_item(
     item_id: UUID = Path(...),
@@ -171,7 +247,9 @@ async def delete_item(
     
     - **item_id**: The ID of the item to delete
     """
-    item = await item_service.get(db, id=item_id)
+    item, is_owner = await get_item_and_check_owner(
+        db, item_id, UUID(current_user.id)
+    )
     
     if not item:
         raise HTTPException(
@@ -180,7 +258,7 @@ async def delete_item(
         )
     
     # Check ownership or superuser status
-    if item.owner_id != UUID(current_user.id) and not current_user.is_superuser:
+    if not is_owner and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
@@ -2,7 +2,7 @@
 
 # app/api/v1/items/schemas.py
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, HttpUrl
@@ -45,6 +45,24 @@ class ItemResponse(ItemBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_trusted(cls, item: Any) -> "ItemResponse":
+        """
+        Build from a database row without running validation.
+        
+        Rows were validated on the way in, so the validators are skipped.
+        """
+        return cls.model_construct(
+            id=item.id,
+            name=item.name,
+            description=item.description,
+            price=item.price,
+            image_url=item.image_url,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            owner_id=item.owner_id,
+        )
+
 
 class ItemListResponse(BaseModel):
     """
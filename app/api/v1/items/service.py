@@ -1,16 +1,26 @@
 
 # app/api/v1/items/service.py
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func, select
+from cachetools import TTLCache
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from app.api.v1.items.models import Item
 from app.api.v1.items.schemas import ItemCreate, ItemUpdate
+from app.core.config import settings
 from app.db.base import CRUDBase
-from app.services.cache import cached, clear_cache_by_pattern
+from app.services.cache import cached, clear_cache_namespace
+
+# Hot rows kept in process in front of Redis. Writes in this process clear
+# it; copies held by other workers expire within the TTL.
+_local_rows: TTLCache = TTLCache(maxsize=2048, ttl=5)
+
+# Bumped by every clear, so reads that started before a write don't refill
+# the local cache with the rows they fetched
+_local_generation = 0
 
 
 class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
@@ -18,15 +28,104 @@ class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
     Service for Item operations.
     """
     
+    async def _clear_cache(self) -> None:
+        global _local_generation
+        
+        # Bumped again once Redis is cleared, as reads in between can still
+        # find the old rows there
+        _local_generation += 1
+        _local_rows.clear()
+        await clear_cache_namespace("items")
+        _local_generation += 1
+        _local_rows.clear()
+    
+    @cached(namespace="items")
+    async def _get_row(self, db: AsyncSession, id: UUID) -> Optional[Dict[str, Any]]:
+        item = await super().get(db, id)
+        return item.dict() if item else None
+    
+    @staticmethod
+    def _owned_by(
+        stmt: StatementLambdaElement,
+        owner_id: Optional[UUID],
+    ) -> StatementLambdaElement:
+        # Lambda statements are compiled once per shape and cached; the
+        # closure variables become bound parameters on each call
+        if owner_id:
+            stmt += lambda s: s.where(Item.owner_id == owner_id)
+        return stmt
+    
+    async def _count(self, db: AsyncSession, owner_id: Optional[UUID]) -> int:
+        stmt = self._owned_by(
+            lambda_stmt(lambda: select(func.count(Item.id)).select_from(Item)),
+            owner_id,
+        )
+        result = await db.execute(stmt)
+        return result.scalar() or 0
+    
+    @cached(namespace="items")
+    async def _get_multi_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int,
+        limit: int,
+        owner_id: Optional[UUID],
+    ) -> List[Dict[str, Any]]:
+        stmt = self._owned_by(lambda_stmt(lambda: select(Item)), owner_id)
+        stmt += lambda s: s.offset(skip).limit(limit)
+        
+        result = await db.execute(stmt)
+        return [item.dict() for item in result.scalars().all()]
+    
     @cached(namespace="items")
+    async def _get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int,
+        limit: int,
+        owner_id: Optional[UUID],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        # Same single-query page + COUNT(*) OVER () as get_multi_with_count
+        stmt = self._owned_by(
+            lambda_stmt(lambda: select(Item, func.count().over().label("total"))),
+            owner_id,
+        )
+        stmt += lambda s: s.offset(skip).limit(limit)
+        
+        result = await db.execute(stmt)
+        rows = result.all()
+        
+        if rows:
+            return [row[0].dict() for row in rows], rows[0].total
+        
+        # An empty page past the end carries no window value
+        if skip:
+            return [], await self._count(db, owner_id)
+        return [], 0
+    
     async def get(self, db: AsyncSession, id: UUID) -> Optional[Item]:
         """
         Get an Item by ID with caching.
+        
+        Rows are looked up in process first, then in Redis. Cached rows are
+        merged into the session without a query, so the result can be
+        updated or deleted like a freshly loaded one.
         """
-        return await super().get(db, id)
+        row = _local_rows.get(id) if settings.CACHE_ENABLED else None
+        
+        if row is None:
+            generation = _local_generation
+            row = await self._get_row(db, id=id)
+            if row is None:
+                return None
+            if settings.CACHE_ENABLED and generation == _local_generation:
+                _local_rows[id] = row
+        
+        return await db.merge(self.from_row(row), load=False)
     
-    @cached(namespace="items")
-    async def get_multi(
+    async def get_multi(  # type: ignore[override]
         self,
         db: AsyncSession,
         *,
@@ -37,15 +136,29 @@ class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
         """
         Get multiple Items with optional filtering by owner and caching.
         """
-        query = select(Item)
-        
-        if owner_id:
-            query = query.where(Item.owner_id == owner_id)
-        
-        return await super().get_multi(db, skip=skip, limit=limit, query=query)
+        rows = await self._get_multi_rows(
+            db, skip=skip, limit=limit, owner_id=owner_id
+        )
+        return [self.from_row(row) for row in rows]
+    
+    async def get_multi_with_count(  # type: ignore[override]
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        owner_id: Optional[UUID] = None,
+    ) -> Tuple[List[Item], int]:
+        """
+        Get a page of Items and the total count in one query, with caching.
+        """
+        rows, total = await self._get_page_rows(
+            db, skip=skip, limit=limit, owner_id=owner_id
+        )
+        return [self.from_row(row) for row in rows], total
     
     @cached(namespace="items")
-    async def count(
+    async def count(  # type: ignore[override]
         self,
         db: AsyncSession,
         *,
@@ -54,13 +167,16 @@ class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
         """
         Count Items with optional filtering by owner and caching.
         """
-        query = select(Item)
-        
-        if owner_id:
-            query = query.where(Item.owner_id == owner_id)
-        
-        return await super().count(db, query=query)
-    
+        return await self._count(db, owner_id)
+
+    # The estimate only moves on ANALYZE, so writes don't clear it
+    @cached(namespace="items-estimate", expire=60)
+    async def get_estimated_count(self, db: AsyncSession) -> int:
+        """
+        Approximate total number of Items, for unfiltered dashboard totals.
+        """
+        return await super().get_estimated_count(db)
+
     async def create(
         self,
         db: AsyncSession,
@@ -76,30 +192,53 @@ class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
         if owner_id:
             obj_in_data["owner_id"] = owner_id
         
-        db_obj = Item(**obj_in_data)
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        db_obj = await super().create(db, obj_in=obj_in_data)
         
-        # Clear cache
-        clear_cache_by_pattern("items:*")
+        await self._clear_cache()
         
         return db_obj
     
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[ItemCreate, Dict[str, Any]]],
+        owner_id: Optional[UUID] = None,
+    ) -> List[Item]:
+        """
+        Create several Items with optional owner in one round trip.
+        """
+        rows = [
+            dict(obj_in) if isinstance(obj_in, dict) else obj_in.model_dump()
+            for obj_in in objs_in
+        ]
+        
+        if owner_id:
+            for row in rows:
+                row["owner_id"] = owner_id
+        
+        result = await super().create_many(db, objs_in=rows)
+        
+        await self._clear_cache()
+        
+        return result
+    
     async def update(
         self,
         db: AsyncSession,
         *,
         db_obj: Item,
         obj_in: Union[ItemUpdate, Dict[str, Any]],
+        commit: bool = True,
     ) -> Item:
         """
         Update an Item.
         """
-        result = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        result = await super().update(
+            db, db_obj=db_obj, obj_in=obj_in, commit=commit
+        )
         
-        # Clear cache
-        clear_cache_by_pattern("items:*")
+        await self._clear_cache()
         
         return result
     
@@ -114,8 +253,7 @@ class ItemService(CRUDBase[Item, ItemCreate, ItemUpdate]):
         """
         result = await super().delete(db, id=id)
         
-        # Clear cache
-        clear_cache_by_pattern("items:*")
+        await self._clear_cache()
         
         return result
 
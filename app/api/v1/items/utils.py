@@ -1,9 +1,9 @@
 
 # app/api/v1/items/utils.py
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.items.models import Item
@@ -23,9 +23,9 @@ async def check_item_exists(
     Returns:
         True if the item exists, False otherwise
     """
-    query = select(Item).where(Item.id == item_id)
+    query = select(literal(1)).select_from(Item).where(Item.id == item_id).limit(1)
     result = await db.execute(query)
-    return result.scalars().first() is not None
+    return result.scalar() is not None
 
 
 async def check_item_owner(
@@ -44,9 +44,42 @@ async def check_item_owner(
     Returns:
         True if the user is the owner, False otherwise
     """
-    query = select(Item).where(
-        Item.id == item_id,
-        Item.owner_id == user_id,
+    query = (
+        select(literal(1))
+        .select_from(Item)
+        .where(
+            Item.id == item_id,
+            Item.owner_id == user_id,
+        )
+        .limit(1)
     )
     result = await db.execute(query)
-    return result.scalars().first() is not None
\ No newline at end of file
+    return result.scalar() is not None
+
+
+async def get_item_and_check_owner(
+    db: AsyncSession,
+    item_id: UUID,
+    user_id: UUID,
+) -> Tuple[Optional[Item], bool]:
+    """
+    Get an item and whether a user owns it, in a single query.
+    
+    Args:
+        db: Database session
+        item_id: ID of the item to get
+        user_id: ID of the user to check
+        
+    Returns:
+        A tuple of (item, is_owner); the item is None if it doesn't exist
+    """
+    # owner_id is a legacy Column, so the comparison isn't typed as an SQL expression
+    query: Select = select(
+        Item, (Item.owner_id == user_id).label("is_owner")
+    ).where(Item.id == item_id)
+    result = await db.execute(query)
+    row = result.first()
+    
+    if row is None:
+        return None, False
+    return row.Item, bool(row.is_owner)
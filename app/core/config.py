@@ -2,7 +2,7 @@
 import os
 import secrets
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, Field, PostgresDsn, OracleDsn, RedisDsn, validator
@@ -26,10 +26,28 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
+    # Explicit lists keep preflight responses fixed instead of echoing the
+    # requested headers back
+    BACKEND_CORS_METHODS: List[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    BACKEND_CORS_HEADERS: List[str] = ["Authorization", "Content-Type", "If-None-Match"]
     PROJECT_NAME: str = "FastAPI Boilerplate"
+    DEBUG: bool = False  # Auto-reload the dev server on code changes
+    # One per CPU, as each worker opens its own DB pool (see below); rate
+    # limit and cache state live in Redis, so they stay consistent across
+    # worker processes
+    WORKERS: int = Field(default_factory=lambda: os.cpu_count() or 1)
     
     # Database
     DATABASE_TYPE: DatabaseType = DatabaseType.POSTGRES
+    # Connection pool, per worker process. Size + overflow should cover the
+    # requests a worker serves at once, and WORKERS * (size + overflow) must
+    # stay under the server's max_connections.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800
+    # Off by default: recycling covers idle drops without a SELECT 1 per checkout
+    DB_POOL_PRE_PING: bool = False
     
     # PostgreSQL
     POSTGRES_SERVER: str = "localhost"
@@ -53,6 +71,9 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: str = ""
     REDIS_DB: int = 0
     REDIS_URI: Optional[RedisDsn] = None
+    REDIS_POOL_SIZE: int = 50  # Per worker process
+    # Seconds a caller waits for a free pooled connection before failing
+    REDIS_POOL_TIMEOUT: int = 5
     
     # MinIO
     MINIO_SERVER: str = "localhost"
@@ -60,10 +81,20 @@ class Settings(BaseSettings):
     MINIO_ROOT_USER: str = "minioadmin"
     MINIO_ROOT_PASSWORD: str = "minioadmin"
     MINIO_BUCKET_NAME: str = "app-bucket"
+    # Multipart uploads send up to MINIO_UPLOAD_CONCURRENCY parts at once, each
+    # held in memory, so one upload peaks near (concurrency + 1) * part size
+    MINIO_UPLOAD_CONCURRENCY: int = 8
+    MINIO_PART_SIZE: int = 16 * 1024 * 1024
+    # Keep-alive connections kept per worker process; covers the client's
+    # thread pool plus concurrent part uploads
+    MINIO_POOL_SIZE: int = 64
     
     # Security
     ALGORITHM: str = "HS256"
     SWAGGER_UI_ENABLED: bool = True
+    # Argon2id cost; lower it in local/test envs to speed up logins
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_COST: int = 19456  # KiB
     
     # Rate limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -119,8 +150,9 @@ class Settings(BaseSettings):
         password_part = f":{values.get('REDIS_PASSWORD')}@" if values.get("REDIS_PASSWORD") else ""
         return f"redis://{password_part}{values.get('REDIS_SERVER')}:{values.get('REDIS_PORT')}/{values.get('REDIS_DB')}"
     
-    @property
+    @cached_property
     def DATABASE_URI(self) -> str:
+        # Computed on first access only; the DSN fields don't change at runtime
         if self.DATABASE_TYPE == DatabaseType.POSTGRES:
             return str(self.POSTGRES_DATABASE_URI)
         elif self.DATABASE_TYPE == DatabaseType.ORACLE:
@@ -1,31 +1,51 @@
 
 # app/core/db.py
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from typing import AsyncIterator
 
-from app.core.config import settings
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import DatabaseType, settings
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
-# Create async engine based on configured database
+connect_args = {}
+
+if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
+    # Keep parsed statements on both sides across requests, and skip JIT
+    # compilation, which only pays off for long analytical queries
+    connect_args = {
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    }
+
+# Create async engine based on configured database. Pool limits come from
+# settings; see DB_POOL_SIZE.
 engine = create_async_engine(
     settings.DATABASE_URI,
     echo=settings.ENV == "local",
     future=True,
-    pool_pre_ping=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args,
 )
 
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
 )
 
 
-async def get_db() -> AsyncSession:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Dependency for getting async database session."""
     async with AsyncSessionLocal() as session:
         try:
@@ -33,3 +53,19 @@ async def get_db() -> AsyncSession:
         finally:
             await session.close()
 
+
+async def get_db_deferred_commit() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency for a session that is committed after the response is sent.
+    
+    Yield dependencies in the default request scope run their exit code once
+    the response has gone out, so handlers can flush changes and skip waiting
+    for the commit. Use only where losing the write on a failed commit is
+    acceptable.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        finally:
+            await session.close()
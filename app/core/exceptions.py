@@ -1,8 +1,12 @@
 
 # app/core/exceptions.py
-from fastapi import FastAPI, Request, status
+from functools import lru_cache
+
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Optional, List, Union
 
 from app.core.config import settings
@@ -61,13 +65,28 @@ class ForbiddenException(AppExceptionBase):
         super().__init__(status.HTTP_403_FORBIDDEN, message, detail)
 
 
+@lru_cache(maxsize=256)
+def _message_body(message: str) -> bytes:
+    """Encoded body for an error without detail; messages are mostly constant."""
+    return orjson.dumps({"message": message, "detail": None})
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """
     Setup exception handlers for the FastAPI application.
     """
     @app.exception_handler(AppExceptionBase)
-    async def app_exception_handler(request: Request, exc: AppExceptionBase) -> JSONResponse:
-        return JSONResponse(
+    async def app_exception_handler(
+        request: Request, exc: AppExceptionBase
+    ) -> Response:
+        if exc.detail is None:
+            return Response(
+                content=_message_body(exc.message),
+                status_code=exc.status_code,
+                media_type="application/json",
+            )
+        
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "message": exc.message,
@@ -76,17 +95,22 @@ def setup_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        return JSONResponse(
+    async def validation_exception_handler(
+        request: Request, exc: RequestValidationError
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "message": "Validation error",
-                "detail": exc.errors(),
+                # errors() can carry exception objects in "ctx"
+                "detail": jsonable_encoder(exc.errors()),
             },
         )
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def unhandled_exception_handler(
+        request: Request, exc: Exception
+    ) -> ORJSONResponse:
         # In production, you might want to log this error
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         message = "Internal server error"
@@ -95,7 +119,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         if settings.ENV == "local":
             message = str(exc)
             
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "message": message,
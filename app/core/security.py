@@ -1,28 +1,95 @@
 
 # app/core/security.py
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Union
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from pydantic import ValidationError
 
-from app.core.config import settings
 from app.api.v1.auth.schemas import TokenPayload, UserOut
+from app.core.config import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Bound once, so signing and verifying tokens skip the settings lookup
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+password_hasher = PasswordHasher(
+    time_cost=settings.PASSWORD_HASH_TIME_COST,
+    memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+    parallelism=1,
+)
+
+# Checked against when no user matches, so unknown usernames take as long
+# to reject as wrong passwords
+DUMMY_PASSWORD_HASH = password_hasher.hash("dummy-password")
+
+# Recently verified (hash, password) pairs, stored as digests keyed with a
+# server-side pepper so plaintext passwords are never kept in memory
+_verified_passwords: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_password_pepper = hashlib.blake2b(SECRET_KEY.encode()).digest()
+
+# Verified token payloads, keyed by a digest of the raw token
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Tokens that failed verification, kept briefly to absorb repeated bad tokens
+_jwt_invalid_cache: TTLCache = TTLCache(maxsize=10_000, ttl=2)
+
+# Timestamps of the stub user from get_current_user; it has no row to take
+# real ones from
+STUB_USER_TIMESTAMP = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 def create_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    """Hash a password using Argon2id."""
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash using bcrypt."""
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    """Verify a password against an Argon2id or legacy bcrypt hash."""
+    if hashed_password.startswith("$2"):
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password, skipping the hash computation for recent matches.
+    
+    Only successful checks are cached. Entries are keyed by the stored hash,
+    so changing a password invalidates them. The cache is only touched on the
+    event loop, since TTLCache isn't thread-safe; just the hash check itself
+    runs in a worker thread.
+    """
+    key = hashlib.blake2b(
+        hashed_password.encode() + b"\0" + plain_password.encode(),
+        key=_password_pepper,
+        digest_size=16,
+    ).digest()
+    
+    if key in _verified_passwords:
+        return True
+    
+    # Password hashing is CPU-bound, so keep it off the event loop
+    if not await asyncio.to_thread(verify_password, plain_password, hashed_password):
+        return False
+    
+    _verified_passwords[key] = True
+    return True
 
 
 def create_access_token(
@@ -33,18 +100,59 @@ def create_access_token(
     """
     Create a JWT token.
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    expire = datetime.utcnow() + (expires_delta or ACCESS_TOKEN_EXPIRE)
     
     to_encode = {"exp": expire, "sub": str(subject)}
     if extra_data:
         to_encode.update(extra_data)
     
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def _token_key(token: str) -> bytes:
+    """Build the cache key for a token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify a JWT token and return its payload, or None if it is invalid.
+    
+    Results are cached per process, so a token presented repeatedly is only
+    verified once. The cache is only touched synchronously, so it needs no
+    lock.
+    """
+    key = _token_key(token)
+    
+    payload: Optional[Dict[str, Any]] = _jwt_cache.get(key)
+    if payload is not None:
+        # Cached entries skip jwt.decode, so expiry has to be checked here
+        if time.time() > payload["exp"]:
+            return None
+        return payload
+    
+    if key in _jwt_invalid_cache:
+        return None
+    
+    try:
+        # Expiry and required claims are enforced by jwt.decode itself
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={
+                "verify_exp": True,
+                "require_exp": True,
+                "require_sub": True,
+                "require_jti": True,
+            },
+        )
+    except JWTError:
+        _jwt_invalid_cache[key] = True
+        return None
+    
+    _jwt_cache[key] = payload
+    return payload
 
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserOut:
@@ -60,25 +168,26 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserOut:
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-        
-        if token_data.exp < datetime.utcnow().timestamp():
-            raise credentials_exception
-            
-    except (JWTError, ValidationError):
+    payload = decode_access_token(token)
+    
+    if payload is None:
         raise credentials_exception
-        
+    
+    # Signed by us and checked for the required claims, so skip validation
+    token_data = TokenPayload.model_construct(**payload)
+    
     # In a real app, get the user from database here
-    # For now, we'll return a dummy user
-    user = UserOut(
+    # For now, we'll return a dummy user, built without validation, so
+    # every field UserOut requires is set here
+    user = UserOut.model_construct(
         id=token_data.sub,
         email="user@example.com",
         username="user",
+        full_name=None,
         is_active=True,
+        is_superuser=False,
+        created_at=STUB_USER_TIMESTAMP,
+        updated_at=STUB_USER_TIMESTAMP,
     )
     
     if not user:
@@ -1,19 +1,45 @@
 # app/db/base.py
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, delete, func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.expression import Select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.sql.expression import ColumnElement, Select
 
+from app.core.config import DatabaseType, settings
 from app.core.db import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Column types that come back from the cache as strings
+ROW_PARSERS: Dict[type, Callable[[str], Any]] = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+}
+
+# reltuples is -1 until the table is first vacuumed or analyzed
+ESTIMATED_COUNT_QUERY = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+)
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -22,14 +48,58 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        # Column names, computed once instead of on every update. Read from
+        # the table so mappers don't have to be configured at import time.
+        self._columns = frozenset(model.__table__.columns.keys())
+        self._row_parsers: Dict[str, Callable[[str], Any]] = {}
+        
+        for column in model.__table__.columns:
+            try:
+                parser = ROW_PARSERS.get(column.type.python_type)
+            except NotImplementedError:
+                parser = None
+            if parser:
+                self._row_parsers[column.name] = parser
+
+    def from_row(self, row: Dict[str, Any]) -> ModelType:
+        """
+        Rebuild a detached record from a cached row.
+        
+        Values serialized as strings are parsed back to their column type,
+        and the instance is marked as loaded, so it can be merged into a
+        session without a query.
+        """
+        values = dict(row)
+        
+        for name, parser in self._row_parsers.items():
+            if isinstance(values.get(name), str):
+                values[name] = parser(values[name])
+        
+        db_obj: ModelType = self.model(**values)
+        make_transient_to_detached(db_obj)
+        return db_obj
 
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """
         Get a record by ID.
+        
+        Uses the session's identity map, so objects already loaded in this
+        session are returned without a query.
         """
-        query = select(self.model).where(self.model.id == id)
+        return await db.get(self.model, id)
+
+    async def get_many(self, db: AsyncSession, ids: Sequence[Any]) -> List[ModelType]:
+        """
+        Get the records with the given IDs in a single query.
+        
+        IDs without a matching record are skipped; order is not preserved.
+        """
+        if not ids:
+            return []
+        
+        query = select(self.model).where(self.model.id.in_(ids))
         result = await db.execute(query)
-        return result.scalars().first()
+        return list(result.scalars().all())
 
     async def get_multi(
         self,
@@ -49,23 +119,104 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await db.execute(query)
         return result.scalars().all()
 
-    async def count(
+    async def get_multi_stream(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        whereclause: Optional[ColumnElement[bool]] = None,
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Stream records as column mappings, without building ORM objects.
+        
+        Rows are yielded as the driver delivers them, so callers can start
+        sending before the whole page has been read.
+        """
+        query = select(*self.model.__table__.columns)
+        
+        if whereclause is not None:
+            query = query.where(whereclause)
+        
+        result = await db.stream(query.offset(skip).limit(limit))
+        
+        async for row in result.mappings():
+            yield row
+
+    async def get_multi_with_count(
         self,
         db: AsyncSession,
         *,
+        skip: int = 0,
+        limit: int = 100,
         query: Optional[Select] = None,
-    ) -> int:
+    ) -> Tuple[List[ModelType], int]:
         """
-        Count records matching the query.
+        Get a page of records together with the total number of matches.
+        
+        The total comes from a COUNT(*) OVER () window on the page query,
+        so both values are fetched in a single round trip.
         """
         if query is None:
-            query = select(func.count()).select_from(self.model)
-        else:
-            query = select(func.count()).select_from(query.subquery())
+            query = select(self.model)
+        
+        page_query = (
+            query.add_columns(func.count().over().label("total"))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(page_query)
+        rows = result.all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        # An empty page past the end carries no window value
+        if skip:
+            return [], await self.count(db, whereclause=query.whereclause)
+        return [], 0
+
+    async def count(
+        self,
+        db: AsyncSession,
+        *,
+        whereclause: Optional[ColumnElement[bool]] = None,
+    ) -> int:
+        """
+        Count records matching the filter.
+        
+        Counts the primary key straight off the table, so the filter is
+        planned directly instead of through a subquery and Postgres can
+        answer from the index.
+        """
+        query = select(func.count(self.model.id)).select_from(self.model)
+        
+        if whereclause is not None:
+            query = query.where(whereclause)
         
         result = await db.execute(query)
         return result.scalar() or 0
 
+    async def get_estimated_count(self, db: AsyncSession) -> int:
+        """
+        Approximate number of rows in the table.
+        
+        On Postgres this reads the planner's row estimate from pg_class
+        instead of scanning, so it is only as fresh as the last
+        VACUUM/ANALYZE. Falls back to an exact count elsewhere, or when the
+        table has never been analyzed.
+        """
+        if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
+            result = await db.execute(
+                ESTIMATED_COUNT_QUERY,
+                {"table": self.model.__tablename__},
+            )
+            estimate: Optional[int] = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+        
+        return await self.count(db)
+
     async def create(
         self,
         db: AsyncSession,
@@ -74,51 +225,94 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> ModelType:
         """
         Create a new record.
+        
+        INSERT ... RETURNING hands back the generated columns with the
+        insert itself, so no refresh query is needed after the commit.
         """
         obj_in_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
-        db_obj = self.model(**obj_in_data)  # type: ignore
         
-        db.add(db_obj)
+        result = await db.execute(
+            insert(self.model).values(**obj_in_data).returning(self.model)
+        )
+        db_obj = result.scalar_one()
         await db.commit()
-        await db.refresh(db_obj)
         
         return db_obj
 
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+    ) -> List[ModelType]:
+        """
+        Create several records with one batched INSERT ... RETURNING.
+        """
+        if not objs_in:
+            return []
+        
+        rows = [
+            obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+            for obj_in in objs_in
+        ]
+        result = await db.execute(insert(self.model).returning(self.model), rows)
+        db_objs = list(result.scalars().all())
+        await db.commit()
+        
+        return db_objs
+
     async def update(
         self,
         db: AsyncSession,
         *,
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = True,
     ) -> ModelType:
         """
         Update a record.
+        
+        With commit=False the changes are only flushed, leaving the commit
+        to the caller.
         """
-        obj_data = jsonable_encoder(db_obj)
         update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
         
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        # Assign native values straight from the update payload
+        for field, value in update_data.items():
+            if field in self._columns:
+                setattr(db_obj, field, value)
         
         db.add(db_obj)
+        
+        if not commit:
+            await db.flush()
+            return db_obj
+        
         await db.commit()
-        await db.refresh(db_obj)
+        
+        # The payload and Python-side defaults like updated_at are already on
+        # the instance; only reload it if the commit expired its attributes
+        if db.sync_session.expire_on_commit:
+            await db.refresh(db_obj)
         
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: Any) -> ModelType:
         """
         Delete a record by ID.
+        
+        DELETE ... RETURNING removes the row and hands it back in a single
+        statement, without loading it first.
         """
-        query = select(self.model).where(self.model.id == id)
-        result = await db.execute(query)
-        obj = result.scalars().first()
+        result = await db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model)
+        )
+        obj = result.scalar_one_or_none()
         
         if obj:
-            await db.delete(obj)
+            # RETURNING puts the row back in the identity map; drop it so
+            # later lookups in this session don't find the deleted record
+            db.expunge(obj)
             await db.commit()
             
         return obj
-
-
@@ -1,7 +1,7 @@
 
 # app/db/factories.py
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings, DatabaseType
 
@@ -13,8 +13,11 @@ def get_engine() -> AsyncEngine:
     if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
         # For PostgreSQL with pgvector
         connect_args = {
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 1024,
             "server_settings": {
                 "search_path": "public",
+                "jit": "off",
                 # Load pgvector extension on connection
                 "options": "-c search_path=public -c shared_preload_libraries=pgvector"
             }
@@ -25,7 +28,12 @@ def get_engine() -> AsyncEngine:
             future=True,
             echo=settings.ENV == "local",
             connect_args=connect_args,
-            pool_pre_ping=True,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
         )
     elif settings.DATABASE_TYPE == DatabaseType.ORACLE:
         # For Oracle
@@ -33,20 +41,23 @@ def get_engine() -> AsyncEngine:
             settings.DATABASE_URI,
             future=True,
             echo=settings.ENV == "local",
-            pool_pre_ping=True,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
         )
     else:
         raise ValueError(f"Unsupported database type: {settings.DATABASE_TYPE}")
 
 
-def get_session_factory(engine: AsyncEngine) -> sessionmaker:
+def get_session_factory(engine: AsyncEngine) -> async_sessionmaker:
     """
     Create session factory for the given engine.
     """
-    return sessionmaker(
+    return async_sessionmaker(
         bind=engine,
-        class_=AsyncSession,
-        autocommit=False,
         autoflush=False,
         expire_on_commit=False,
     )
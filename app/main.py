@@ -0,0 +1,104 @@
+
+# app/main.py
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from loguru import logger
+
+from app.api.router import api_router
+from app.core.config import settings
+from app.core.exceptions import setup_exception_handlers
+from app.core.logging import AccessLogMiddleware, setup_logging
+from app.services.cache import setup_cache
+from app.services.minio import minio_service
+from app.services.ratelimit import RateLimitMiddleware
+from app.services.redis import redis_service
+
+setup_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Connect shared services on startup and release them on shutdown."""
+    await redis_service.connect()
+    await setup_cache()
+
+    # Check the bucket now rather than on the first upload. MinIO being
+    # down shouldn't hold up the API, so uploads retry the check until it works.
+    try:
+        await asyncio.wait_for(minio_service.ensure_bucket_exists(), timeout=10)
+    except Exception as e:
+        logger.warning(f"Could not check MinIO bucket at startup: {e}")
+
+    yield
+
+    await redis_service.disconnect()
+    minio_service.close()
+
+
+app = FastAPI(
+    title=settings.PROJECT_NAME,
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    docs_url="/docs" if settings.SWAGGER_UI_ENABLED else None,
+    redoc_url="/redoc" if settings.SWAGGER_UI_ENABLED else None,
+    lifespan=lifespan,
+)
+
+# Throttle before routing, so rejected requests never reach the handlers
+app.add_middleware(RateLimitMiddleware)
+
+# Origins are compared verbatim to the Origin header, which never has the
+# trailing slash AnyHttpUrl adds; a set makes each check a hash lookup
+CORS_ORIGINS = frozenset(
+    str(origin).rstrip("/") for origin in settings.BACKEND_CORS_ORIGINS
+)
+
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=settings.BACKEND_CORS_METHODS,
+        allow_headers=settings.BACKEND_CORS_HEADERS,
+        # Let browsers reuse preflight results for a day outside development
+        max_age=600 if settings.DEBUG else 86400,
+    )
+
+# Added last so it is outermost and also logs throttled requests
+app.add_middleware(AccessLogMiddleware)
+
+setup_exception_handlers(app)
+
+app.include_router(api_router, prefix=settings.API_V1_STR)
+
+
+# Built once; probes get the same immutable response every time
+HEALTH_RESPONSE = PlainTextResponse("ok", headers={"Cache-Control": "no-store"})
+
+
+@app.get("/health", tags=["health"], response_class=PlainTextResponse)
+async def health() -> PlainTextResponse:
+    """Health check used by the container and k8s probes."""
+    return HEALTH_RESPONSE
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        # Requests are logged by AccessLogMiddleware
+        access_log=False,
+        # The reloader only supervises a single worker
+        reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.WORKERS,
+    )
@@ -1,8 +1,9 @@
 
 # app/models/base.py
+import operator
 import uuid
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from sqlalchemy import Column, DateTime, String
 from sqlalchemy.dialects.postgresql import UUID
@@ -33,10 +34,22 @@ class BaseModel(Base):
         nullable=False,
     )
 
+    @classmethod
+    def _column_names(cls) -> Tuple[str, ...]:
+        """Column names of the model's table, computed once per class."""
+        # Looked up in the class's own __dict__ so subclasses get their own
+        cached: Optional[Tuple[str, ...]] = cls.__dict__.get("__col_names__")
+        if cached is not None:
+            return cached
+
+        names = tuple(column.name for column in cls.__table__.columns)
+        cls.__col_names__ = names
+        # Every model has at least id/created_at/updated_at, so the getter
+        # always returns a tuple
+        cls.__col_getter__ = operator.attrgetter(*names)
+        return names
+
     def dict(self) -> Dict[str, Any]:
         """Convert SQLAlchemy model instance to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
-
+        names = self._column_names()
+        return dict(zip(names, self.__col_getter__(self), strict=True))
@@ -1,73 +1,359 @@
 
 # app/services/cache.py
-from functools import wraps
-from typing import Any, Callable, Optional, Type, TypeVar, cast
+import asyncio
+import time
+from functools import lru_cache, wraps
+from inspect import isawaitable, signature
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    ParamSpec,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
+import orjson
 from fastapi import Depends, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
-from fastapi_cache.decorator import cache
+from fastapi_cache.coder import Coder
+from loguru import logger
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.services.redis import redis_service
 
 T = TypeVar('T')
+P = ParamSpec('P')
 
+CACHE_PREFIX = "fastapi-cache:"
 
-def setup_cache() -> None:
-    """Initialize FastAPI Cache with Redis backend."""
+# Unlinks every key recorded in a namespace's tag set, then the set itself,
+# and bumps the namespace version, atomically and in a single round trip.
+# A missing version is seeded from the server clock, like in
+# get_namespace_version().
+CLEAR_NAMESPACE_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 5000 do
+    redis.call('UNLINK', unpack(keys, i, math.min(i + 4999, #keys)))
+end
+redis.call('UNLINK', KEYS[1])
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('INCR', KEYS[2])
+else
+    local now = redis.call('TIME')
+    redis.call('SET', KEYS[2], now[1] * 1000000 + now[2])
+end
+return #keys
+"""
+
+_clear_namespace_script: Optional[AsyncScript] = None
+
+
+def _client() -> Redis:
+    """The shared Redis client, raising a RedisError if it was disconnected."""
     client = redis_service.client
+    if client is None:
+        raise RedisConnectionError("Redis client is not connected")
+    return client
+
+
+class ORJSONCoder(Coder):
+    """Cache coder backed by orjson, which handles UUID and datetime natively."""
     
-    if client and settings.CACHE_ENABLED:
-        FastAPICache.init(
-            RedisBackend(client),
-            prefix="fastapi-cache:",
-            expire=settings.CACHE_EXPIRE_SECONDS,
-        )
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(value, default=jsonable_encoder)
+    
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+class _GetBatcher:
+    """
+    Coalesces cache reads issued in the same event loop tick into one MGET.
+    
+    Concurrent lookups of the same key share a single result.
+    """
+    
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def get(self, key: str) -> "asyncio.Future[Optional[bytes]]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        
+        if self._flush_task is None:
+            # Starts on the next loop iteration, after other ready tasks
+            # have had a chance to queue their keys
+            self._flush_task = loop.create_task(self._flush())
+        return future
+    
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        
+        try:
+            values = await _client().mget(list(pending))
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        
+        for futures, value in zip(pending.values(), values, strict=True):
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+
+
+_get_batcher = _GetBatcher()
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Read a cache entry, batched with other reads in the same tick."""
+    return await _get_batcher.get(key)
+
+
+async def cache_set(key: str, value: bytes, expire: int, namespace: str) -> None:
+    """
+    Write a cache entry and record it in its namespace's tag set.
+    
+    The tag set expires with the longest-lived entry added to it, so keys
+    whose values already expired don't pile up in it.
+    """
+    tag_key = _tag_key(namespace)
+    pipe = _client().pipeline(transaction=False)
+    pipe.set(key, value, ex=expire)
+    pipe.sadd(tag_key, key)
+    # NX covers a new set, GT extends an existing one (Redis 7+)
+    pipe.expire(tag_key, expire, nx=True)
+    pipe.expire(tag_key, expire, gt=True)
+    await pipe.execute()
+
+
+async def setup_cache() -> None:
+    """
+    Initialize FastAPI Cache with Redis backend.
+    
+    Reuses the shared Redis client, connecting it first if needed.
+    """
+    if not settings.CACHE_ENABLED:
+        return
+    
+    client = await redis_service.connect()
+    FastAPICache.init(
+        RedisBackend(client),
+        prefix=CACHE_PREFIX,
+        expire=settings.CACHE_EXPIRE_SECONDS,
+        coder=ORJSONCoder,
+    )
+
+
+# Decorated functions are fixed at import time, so their signatures are too
+_func_signature = lru_cache(maxsize=None)(signature)
+
+
+def semantic_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Any = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build a cache key from the arguments that determine the result.
+    
+    `self` and database sessions are left out, so calls made with different
+    sessions share entries, e.g. `fastapi-cache::items:get:id=<uuid>`.
+    """
+    bound = _func_signature(func).bind(*args, **(kwargs or {}))
+    bound.apply_defaults()
+    
+    params = ":".join(
+        f"{name}={value}"
+        for name, value in bound.arguments.items()
+        if name != "self" and not isinstance(value, AsyncSession)
+    )
+    return f"{namespace}:{func.__name__}:{params}"
+
+
+def _tag_key(namespace: str) -> str:
+    """Key of the Redis set recording every cached key in a namespace."""
+    return f"{CACHE_PREFIX}:{namespace}:keys"
+
+
+def _version_key(namespace: str) -> str:
+    """Key of the counter bumped each time a namespace is cleared."""
+    return f"{CACHE_PREFIX}:{namespace}:version"
+
+
+async def get_namespace_version(namespace: str) -> Optional[str]:
+    """
+    Current version of a namespace, changed by every clear_cache_namespace().
+    
+    Lets endpoints build validators like ETags without touching the
+    database. Returns None when caching is off, as writes then don't bump
+    the version, or when Redis can't be reached.
+    """
+    if not settings.CACHE_ENABLED or not redis_service.client:
+        return None
+    
+    key = _version_key(namespace)
+    
+    try:
+        version = await cache_get(key)
+        
+        if version is None:
+            # Seeded from the clock in microseconds, so a version lost to a
+            # flush or eviction is never handed out again
+            client = _client()
+            await client.set(key, time.time_ns() // 1000, nx=True)
+            # Values stay bytes; the client doesn't decode responses
+            version = cast(Optional[bytes], await client.get(key))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Could not read cache version of {namespace}: {e}")
+        return None
+    
+    return version.decode() if version is not None else None
 
 
 def cached(
     expire: Optional[int] = None,
     key_builder: Optional[Callable[..., str]] = None,
     namespace: Optional[str] = None,
-) -> Callable[[Callable[..., T]], Callable[..., T]]:
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]:
     """
     Cache decorator that respects the CACHE_ENABLED setting.
+    
+    Every key written is added to the namespace's tag set, so the whole
+    namespace can be invalidated with clear_cache_namespace(). Redis errors
+    are logged and the function runs uncached, so an outage only costs
+    speed.
     """
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
         if not settings.CACHE_ENABLED:
             return func
-
+        
+        # Fixed per decorated function, so resolved once here
+        cache_namespace = namespace or func.__module__
+        key_prefix = f"{CACHE_PREFIX}:{cache_namespace}"
+        build_key = key_builder or semantic_key_builder
+        ttl = expire or settings.CACHE_EXPIRE_SECONDS
+        
         @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if FastAPICache.get_backend() is None:
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            # get_backend() asserts when init was never called
+            if redis_service.client is None or FastAPICache._backend is None:
                 return await func(*args, **kwargs)
-                
-            return await cache(
-                expire=expire or settings.CACHE_EXPIRE_SECONDS,
-                key_builder=key_builder,
-                namespace=namespace or func.__module__,
-            )(func)(*args, **kwargs)
             
-        return cast(T, wrapper)
+            coder = FastAPICache.get_coder()
+            cache_key = build_key(
+                func,
+                key_prefix,
+                request=None,
+                response=None,
+                args=args,
+                kwargs=kwargs,
+            )
+            if isawaitable(cache_key):
+                cache_key = await cache_key
+            
+            try:
+                value = await cache_get(cache_key)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache read failed for {cache_key}: {e}")
+                return await func(*args, **kwargs)
+            
+            if value is not None:
+                return cast(T, coder.decode(value))
+            
+            result = await func(*args, **kwargs)
+            
+            try:
+                await cache_set(cache_key, coder.encode(result), ttl, cache_namespace)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache write failed for {cache_key}: {e}")
+            
+            return result
+        
+        return wrapper
     
     return decorator
 
 
-def clear_cache_by_pattern(pattern: str) -> None:
+async def clear_cache_namespace(namespace: str) -> None:
+    """
+    Clear all cache entries written to the given namespace.
+    
+    Only the keys recorded in the namespace's tag set are touched, so the
+    cost is bounded by the number of cached entries, not the keyspace.
+    Callers clear after committing, so Redis errors are logged rather than
+    raised, and stale entries then expire with their TTL.
+    """
+    global _clear_namespace_script
+    
+    if not settings.CACHE_ENABLED or not redis_service.client:
+        return
+    
+    if _clear_namespace_script is None:
+        _clear_namespace_script = redis_service.client.register_script(
+            CLEAR_NAMESPACE_SCRIPT
+        )
+    
+    try:
+        await _clear_namespace_script(
+            keys=[_tag_key(namespace), _version_key(namespace)]
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"Could not clear cache namespace {namespace}: {e}")
+
+
+async def clear_cache_by_pattern(pattern: str, batch_size: int = 500) -> None:
     """
     Clear cache entries matching the given pattern.
+    
+    Keys are found with SCAN, which walks the keyspace incrementally instead
+    of blocking Redis like KEYS, and removed with pipelined UNLINKs, which
+    free the memory in a background thread. Prefer clear_cache_namespace()
+    where a namespace fits, as it only touches the keys it recorded.
     """
     if not settings.CACHE_ENABLED or not redis_service.client:
         return
-        
-    async def _clear() -> None:
-        client = await redis_service.connect()
-        prefix = FastAPICache.get_prefix()
-        keys = await client.keys(f"{prefix}:{pattern}")
-        
-        if keys:
-            await client.delete(*keys)
     
-    import asyncio
-    asyncio.create_task(_clear())
+    client = redis_service.client
+    pipe = client.pipeline(transaction=False)
+    queued = 0
+    
+    async for key in client.scan_iter(
+        match=f"{CACHE_PREFIX}:{pattern}", count=batch_size
+    ):
+        pipe.unlink(key)
+        queued += 1
+        if queued >= batch_size:
+            await pipe.execute()
+            queued = 0
+    
+    if queued:
+        await pipe.execute()
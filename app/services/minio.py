@@ -1,113 +1,359 @@
 
 # app/services/minio.py
+import asyncio
 import io
-from typing import Any, Dict, List, Optional, Union
+import mimetypes
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
+import certifi
+import urllib3
+from cachetools import TTLCache
 from fastapi import UploadFile
-import aiohttp
 from minio import Minio, S3Error
 from minio.commonconfig import CopySource
+from minio.deleteobjects import DeleteObject
+from urllib3.connection import HTTPConnection
 
 from app.core.config import settings
 
+# The minio SDK blocks, so its calls run on their own pool instead of the
+# event loop, without competing with other users of the default executor
+_minio_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="minio")
+
+# Download chunk size; one chunk per request is held in memory
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Presigned URLs are reused for up to this long, so a cached URL has at most
+# this much less validity left than requested
+PRESIGNED_URL_CACHE_SECONDS = 300
+
+_presigned_urls: TTLCache[Tuple[str, str, timedelta], str] = TTLCache(
+    maxsize=4096, ttl=PRESIGNED_URL_CACHE_SECONDS
+)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Extension to content type, read once from the system tables at import
+mimetypes.init()
+_CONTENT_TYPES: Dict[str, str] = dict(mimetypes.types_map)
+
+
+def _guess_content_type(object_name: str) -> str:
+    """Content type for an object name's extension, with one dict lookup."""
+    dot = object_name.rfind(".")
+    if dot == -1:
+        return DEFAULT_CONTENT_TYPE
+    return _CONTENT_TYPES.get(object_name[dot:].lower(), DEFAULT_CONTENT_TYPE)
+
+
+class _AsyncIteratorReader:
+    """
+    File-like read() over an async iterator, for the client's worker thread.
+    
+    Each chunk is pulled on the event loop, so the upload streams as the
+    iterator produces data instead of collecting it first.
+    """
+    
+    def __init__(
+        self, chunks: AsyncIterable[bytes], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._chunks = chunks.__aiter__()
+        self._loop = loop
+        self._buffer = bytearray()
+        self._done = False
+    
+    async def _next_chunk(self) -> Optional[bytes]:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+    
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            chunk = asyncio.run_coroutine_threadsafe(
+                self._next_chunk(), self._loop
+            ).result()
+            if chunk is None:
+                self._done = True
+            else:
+                self._buffer += chunk
+        
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
 
 class MinioService:
     """Service for interacting with MinIO / S3 storage."""
     
     def __init__(self) -> None:
         parsed_url = urlparse(f"http://{settings.MINIO_SERVER}:{settings.MINIO_PORT}")
+        # The SDK's default pool keeps only 10 connections, fewer than the
+        # threads that use it, so connections were dropped and reopened.
+        # Socket buffers are left to the kernel's autotuning.
+        self._http = urllib3.PoolManager(
+            maxsize=settings.MINIO_POOL_SIZE,
+            timeout=urllib3.Timeout(connect=10, read=300),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+            socket_options=HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+        )
         self.client = Minio(
             f"{parsed_url.netloc}",
             access_key=settings.MINIO_ROOT_USER,
             secret_key=settings.MINIO_ROOT_PASSWORD,
             secure=False,  # Set to True for HTTPS
+            http_client=self._http,
         )
         self.bucket_name = settings.MINIO_BUCKET_NAME
+        # Buckets known to exist, so uploads skip the check after the first
+        self._known_buckets: Set[str] = set()
+        self._bucket_lock = asyncio.Lock()
     
-    async def ensure_bucket_exists(self) -> None:
-        """Ensure the default bucket exists."""
-        if not self.client.bucket_exists(self.bucket_name):
-            self.client.make_bucket(self.bucket_name)
+    def close(self) -> None:
+        """Close the pooled connections to MinIO."""
+        self._http.clear()
+    
+    async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client call on the MinIO thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _minio_executor, partial(func, *args, **kwargs)
+        )
+    
+    async def ensure_bucket_exists(self, bucket_name: Optional[str] = None) -> None:
+        """
+        Ensure a bucket exists (defaults to settings.MINIO_BUCKET_NAME).
+        
+        Checked once per bucket and process; later calls return without a
+        request. The default bucket is checked at startup.
+        """
+        bucket = bucket_name or self.bucket_name
+        if bucket in self._known_buckets:
+            return
+        
+        async with self._bucket_lock:
+            if bucket in self._known_buckets:
+                return
+            
+            if not await self._run(self.client.bucket_exists, bucket):
+                await self._run(self.client.make_bucket, bucket)
+            
+            self._known_buckets.add(bucket)
     
     async def upload_file(
         self,
-        file: UploadFile,
+        file: Union[UploadFile, bytes, bytearray, str, BinaryIO, AsyncIterator[bytes]],
         object_name: Optional[str] = None,
         bucket_name: Optional[str] = None,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
+        length: Optional[int] = None,
+        part_size: Optional[int] = None,
+        concurrent_parts: Optional[int] = None,
     ) -> str:
         """
         Upload a file to MinIO.
         
+        Nothing is read ahead to find the size: bytes and str have a known
+        length, and streams without a given length go up as a multipart
+        upload. For a FastAPI UploadFile pass the UploadFile itself; its
+        spooled file is streamed as is.
+        
+        Objects larger than one part are sent as a multipart upload whose
+        parts go up concurrently on the client's own bounded thread pool.
+        
         Args:
-            file: The file to upload
+            file: The file to upload, as an UploadFile, bytes/str, a binary
+                file object or an async iterator of bytes
             object_name: The name to give the object in the bucket
-            bucket_name: The bucket to upload to (defaults to settings.MINIO_BUCKET_NAME)
-            content_type: The content type of the file
+            bucket_name: The bucket to upload to (defaults to
+                settings.MINIO_BUCKET_NAME)
+            content_type: The content type of the file (guessed from the
+                object name's extension if not given)
             metadata: Additional metadata for the object
+            length: Size of a file object or stream, if known
+            part_size: Multipart part size (defaults to settings.MINIO_PART_SIZE)
+            concurrent_parts: Parts uploaded at once (defaults to
+                settings.MINIO_UPLOAD_CONCURRENCY)
             
         Returns:
             The URL of the uploaded file
         """
-        await self.ensure_bucket_exists()
-        
         bucket = bucket_name or self.bucket_name
-        object_name = object_name or file.filename
+        await self.ensure_bucket_exists(bucket)
+        
+        data: Union[BinaryIO, _AsyncIteratorReader]
+        if isinstance(file, UploadFile):
+            object_name = object_name or file.filename
+            content_type = content_type or file.content_type
+            await file.seek(0)
+            length = file.size if length is None else length
+            data = file.file
+        elif isinstance(file, (str, bytes, bytearray)):
+            raw = file.encode() if isinstance(file, str) else file
+            data = io.BytesIO(raw)
+            length = len(raw)
+        elif isinstance(file, AsyncIterable):
+            data = _AsyncIteratorReader(file, asyncio.get_running_loop())
+        else:
+            data = file
         
         if not object_name:
             raise ValueError("Object name must be provided")
         
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
-        
-        # Set content type if not provided
-        if not content_type:
-            content_type = file.content_type
-        
-        # Upload to MinIO
-        self.client.put_object(
+        await self._run(
+            self.client.put_object,
             bucket_name=bucket,
             object_name=object_name,
-            data=io.BytesIO(content),
-            length=file_size,
-            content_type=content_type,
+            data=data,
+            length=length if length is not None else -1,
+            content_type=content_type or _guess_content_type(object_name),
             metadata=metadata,
+            part_size=part_size or settings.MINIO_PART_SIZE,
+            num_parallel_uploads=concurrent_parts or settings.MINIO_UPLOAD_CONCURRENCY,
         )
         
         # Build URL to the file
-        return f"http://{settings.MINIO_SERVER}:{settings.MINIO_PORT}/{bucket}/{object_name}"
+        base_url = f"http://{settings.MINIO_SERVER}:{settings.MINIO_PORT}"
+        return f"{base_url}/{bucket}/{object_name}"
     
-    async def get_file(
+    async def stream_file(
         self,
         object_name: str,
         bucket_name: Optional[str] = None,
-    ) -> io.BytesIO:
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[AsyncIterator[bytes]], str]:
         """
-        Get a file from MinIO.
+        Stream a file from MinIO.
+        
+        The object is looked up with a HEAD before returning, so a missing
+        object raises S3Error here rather than midway through a response.
+        The download itself is only opened once the iterator is first read,
+        so an iterator that is never consumed holds no connection. Only one
+        chunk is held in memory at a time; pass the result to a
+        StreamingResponse.
+        
+        Pass the ETag of a copy the caller already has as `etag`; if the
+        object hasn't changed no iterator is returned.
         
         Args:
             object_name: The name of the object in the bucket
-            bucket_name: The bucket to get from (defaults to settings.MINIO_BUCKET_NAME)
+            bucket_name: The bucket to get from (defaults to
+                settings.MINIO_BUCKET_NAME)
+            chunk_size: Bytes read from MinIO per chunk
+            etag: ETag of the caller's copy, e.g. from If-None-Match
             
         Returns:
-            A BytesIO object containing the file data
+            An async iterator over the file's bytes, or None if `etag` still
+            matches, and the object's ETag
         """
         bucket = bucket_name or self.bucket_name
         
-        response = self.client.get_object(
+        stat = await self._run(
+            self.client.stat_object,
             bucket_name=bucket,
             object_name=object_name,
         )
+        current = f'"{stat.etag}"'
         
-        data = io.BytesIO()
-        for d in response.stream(32 * 1024):
-            data.write(d)
-        data.seek(0)
+        if etag and etag.removeprefix("W/").strip('"') == stat.etag:
+            return None, current
         
-        return data
+        return self._iter_object(bucket, object_name, current, chunk_size), current
+    
+    async def _iter_object(
+        self, bucket: str, object_name: str, etag: str, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """Open an object, yield its chunks off the loop, then release it."""
+        # If-Match keeps the body in step with the ETag already handed out
+        response = await self._run(
+            self.client.get_object,
+            bucket_name=bucket,
+            object_name=object_name,
+            request_headers={"If-Match": etag},
+        )
+        chunks = response.stream(chunk_size)
+        
+        try:
+            while True:
+                chunk = await self._run(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+    
+    async def get_presigned_url(
+        self,
+        object_name: str,
+        bucket_name: Optional[str] = None,
+        expires: timedelta = timedelta(hours=1),
+    ) -> str:
+        """
+        Get a presigned download URL for a file.
+        
+        URLs are cached per object and expiry, so hot objects aren't
+        signed again on every call. Expiries too short to cache safely are
+        always signed fresh.
+        
+        Args:
+            object_name: The name of the object in the bucket
+            bucket_name: The bucket of the object (defaults to
+                settings.MINIO_BUCKET_NAME)
+            expires: How long the URL stays valid
+            
+        Returns:
+            The presigned URL
+        """
+        bucket = bucket_name or self.bucket_name
+        cacheable = expires.total_seconds() >= 2 * PRESIGNED_URL_CACHE_SECONDS
+        key = (bucket, object_name, expires)
+        
+        if cacheable:
+            cached_url = _presigned_urls.get(key)
+            if cached_url is not None:
+                return cached_url
+        
+        # Signing is local, but the first call may look up the bucket region
+        url: str = await self._run(
+            self.client.presigned_get_object,
+            bucket_name=bucket,
+            object_name=object_name,
+            expires=expires,
+        )
+        
+        if cacheable:
+            _presigned_urls[key] = url
+        return url
     
     async def delete_file(
         self,
@@ -119,7 +365,8 @@ class MinioService:
         
         Args:
             object_name: The name of the object in the bucket
-            bucket_name: The bucket to delete from (defaults to settings.MINIO_BUCKET_NAME)
+            bucket_name: The bucket to delete from (defaults to
+                settings.MINIO_BUCKET_NAME)
             
         Returns:
             True if the file was deleted, False otherwise
@@ -127,7 +374,8 @@ class MinioService:
         bucket = bucket_name or self.bucket_name
         
         try:
-            self.client.remove_object(
+            await self._run(
+                self.client.remove_object,
                 bucket_name=bucket,
                 object_name=object_name,
             )
@@ -135,6 +383,46 @@ class MinioService:
         except S3Error:
             return False
     
+    async def delete_files(
+        self,
+        object_names: Iterable[str],
+        bucket_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Delete several files from MinIO.
+        
+        Uses the bulk delete API, which removes up to 1000 objects per
+        request, instead of one request per object.
+        
+        Args:
+            object_names: The names of the objects in the bucket
+            bucket_name: The bucket to delete from (defaults to
+                settings.MINIO_BUCKET_NAME)
+            
+        Returns:
+            The names of the objects that could not be deleted
+        """
+        bucket = bucket_name or self.bucket_name
+        names = list(object_names)
+        
+        if not names:
+            return []
+        
+        # A single object is cheaper as a plain DELETE than a bulk request
+        if len(names) == 1:
+            return [] if await self.delete_file(names[0], bucket) else names
+        
+        # Errors are reported lazily, batch by batch, so drain them off the loop
+        errors = await self._run(
+            lambda: list(
+                self.client.remove_objects(
+                    bucket_name=bucket,
+                    delete_object_list=(DeleteObject(name) for name in names),
+                )
+            )
+        )
+        return [error.name for error in errors]
+    
     async def list_files(
         self,
         prefix: Optional[str] = None,
@@ -146,7 +434,8 @@ class MinioService:
         
         Args:
             prefix: Filter objects by prefix
-            bucket_name: The bucket to list from (defaults to settings.MINIO_BUCKET_NAME)
+            bucket_name: The bucket to list from (defaults to
+                settings.MINIO_BUCKET_NAME)
             recursive: Whether to list recursively
             
         Returns:
@@ -154,10 +443,15 @@ class MinioService:
         """
         bucket = bucket_name or self.bucket_name
         
-        objects = self.client.list_objects(
-            bucket_name=bucket,
-            prefix=prefix,
-            recursive=recursive,
+        # The listing is paged lazily while iterating, so drain it off the loop
+        objects = await self._run(
+            lambda: list(
+                self.client.list_objects(
+                    bucket_name=bucket,
+                    prefix=prefix,
+                    recursive=recursive,
+                )
+            )
         )
         
         result = []
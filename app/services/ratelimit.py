@@ -1,18 +1,51 @@
 
 # app/services/ratelimit.py
-from datetime import datetime, timedelta
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
-from fastapi import Depends, HTTPException, Request, Response, status
-from fastapi.security import APIKeyHeader
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.api.v1.auth.utils import validate_token
 from app.core.config import settings
 from app.services.redis import redis_service
 
+# Token bucket: refills continuously at ARGV[2] tokens per second up to a
+# capacity of ARGV[1], and takes one token per call. Runs atomically on the
+# Redis server and uses its clock, so all workers share one view of time.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, math.floor(tokens)}
+"""
+
 
 class RateLimiter:
     """
-    Rate limiting service using Redis.
+    Rate limiting service using a Redis token bucket.
     """
     
     def __init__(
@@ -24,6 +57,9 @@ class RateLimiter:
         self.redis_prefix = redis_prefix
         self.requests = requests or settings.RATE_LIMIT_REQUESTS
         self.window_seconds = window_seconds or settings.RATE_LIMIT_WINDOW_SECONDS
+        # Capacity and refill rate never change, so build the script args once
+        self._script_args = [self.requests, self.requests / self.window_seconds]
+        self._script: Optional[AsyncScript] = None
     
     async def is_rate_limited(self, key: str) -> Tuple[bool, int, int]:
         """
@@ -31,7 +67,7 @@ class RateLimiter:
         
         Args:
             key: The key to check
-            
+        
         Returns:
             A tuple of (is_limited, current_usage, limit)
         """
@@ -41,19 +77,16 @@ class RateLimiter:
         redis_key = f"{self.redis_prefix}{key}"
         client = await redis_service.connect()
         
-        # Get current count and TTL
-        pipe = client.pipeline()
-        await pipe.incr(redis_key)
-        await pipe.ttl(redis_key)
-        count, ttl = await pipe.execute()
+        if self._script is None:
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
         
-        # Set expiry if this is the first request
-        if ttl < 0:
-            await client.expire(redis_key, self.window_seconds)
-            ttl = self.window_seconds
+        # One EVALSHA round trip refills and takes a token atomically
+        allowed, remaining = await self._script(
+            keys=[redis_key],
+            args=self._script_args,
+        )
         
-        is_limited = count > self.requests
-        return is_limited, count, self.requests
+        return not allowed, self.requests - int(remaining), self.requests
     
     async def reset(self, key: str) -> None:
         """Reset the rate limit for a key."""
@@ -62,21 +95,108 @@ class RateLimiter:
         await client.delete(redis_key)
 
 
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying the default rate limit before routing.
+    
+    Throttled requests are rejected before the body is read or any
+    dependency runs. Requests with a valid bearer token are limited per
+    user, all others per client IP. When Redis can't be reached, requests
+    are let through unthrottled rather than failed.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        exclude_paths: Iterable[str] = ("/health",),
+    ) -> None:
+        self.app = app
+        self.limiter = RateLimiter(
+            redis_prefix="ratelimit:global:",
+            requests=requests,
+            window_seconds=window_seconds,
+        )
+        self.exclude_paths = frozenset(exclude_paths)
+    
+    async def _get_key(self, scope: Scope) -> str:
+        """Build the rate limit key for a request."""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    # Served from the verified-token cache on repeat requests
+                    payload = await validate_token(token)
+                    if payload:
+                        return f"user:{payload['sub']}"
+                break
+        
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope["path"] in self.exclude_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        key = await self._get_key(scope)
+        
+        try:
+            is_limited, current, limit = await self.limiter.is_rate_limited(key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Rate limit check failed for {key}: {e}")
+            await self.app(scope, receive, send)
+            return
+        
+        rate_limit_headers = [
+            (b"x-ratelimit-limit", str(limit).encode()),
+            (b"x-ratelimit-remaining", str(max(0, limit - current)).encode()),
+        ]
+        
+        if is_limited:
+            response = ORJSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            response.raw_headers.extend(rate_limit_headers)
+            await response(scope, receive, send)
+            return
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + rate_limit_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
+
+
 # Create a function for use as a dependency
 def rate_limit(
     requests: Optional[int] = None,
     window_seconds: Optional[int] = None,
     key_func: Optional[Callable[[Request], str]] = None,
+    redis_prefix: str = "ratelimit:",
 ):
     """
     Dependency for rate limiting.
     
+    The default limit is applied to every request by RateLimitMiddleware;
+    use this dependency for routes that need a stricter, separate limit.
+    
     Args:
         requests: Maximum number of requests allowed
         window_seconds: Time window in seconds
         key_func: Function to generate the rate limit key from the request
+        redis_prefix: Prefix of the Redis keys holding this limit's buckets
     """
     limiter = RateLimiter(
+        redis_prefix=redis_prefix,
         requests=requests,
         window_seconds=window_seconds,
     )
@@ -100,4 +220,4 @@ def rate_limit(
                 detail="Rate limit exceeded",
             )
     
-    return _rate_limit
\ No newline at end of file
+    return _rate_limit
@@ -10,24 +10,41 @@ class RedisService:
     """Service for interacting with Redis."""
     
     def __init__(self) -> None:
-        self.redis_url = settings.REDIS_URI
+        self.redis_url = str(settings.REDIS_URI)
+        self.pool: Optional[redis.BlockingConnectionPool] = None
         self.client: Optional[redis.Redis] = None
     
     async def connect(self) -> redis.Redis:
-        """Connect to Redis."""
+        """
+        Connect to Redis.
+        
+        Called from the app lifespan; the cache and rate limiter share the
+        resulting client and its connection pool.
+        """
         if self.client is None:
-            self.client = redis.from_url(
-                self.redis_url, 
-                encoding="utf-8", 
-                decode_responses=True
+            # Values stay bytes, so cached payloads skip a decode/encode pass.
+            # The pool is capped, so callers past the cap wait for a free
+            # connection instead of failing with "Too many connections".
+            self.pool = redis.BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                decode_responses=False,
+                socket_keepalive=True,
+                health_check_interval=30,
             )
+            self.client = redis.Redis(connection_pool=self.pool)
         return self.client
     
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self.client:
-            await self.client.close()
+            await self.client.aclose()
             self.client = None
+        
+        if self.pool:
+            await self.pool.disconnect()
+            self.pool = None
     
     async def get(self, key: str) -> Any:
         """Get a value from Redis."""
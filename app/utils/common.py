@@ -0,0 +1,71 @@
+
+# app/utils/common.py
+from typing import Any, AsyncIterator, Mapping, Optional
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+def weak_etag(id: Any, updated_at: Any) -> str:
+    """
+    Build a weak ETag for a record from its ID and last update time.
+    
+    Typed loosely, as the models' columns aren't mapped as datetimes.
+    """
+    return f'W/"{int(updated_at.timestamp() * 1_000_000)}-{id}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check if the client's If-None-Match header matches the given ETag.
+    
+    Uses the weak comparison If-None-Match calls for: the header may list
+    several tags or `*`, and W/ prefixes are ignored on both sides.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def pydantic_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Serialize a model straight to a JSON response with pydantic-core.
+    
+    Skips the intermediate dict that model_dump() builds for a JSON
+    response class. Warnings are off, so models built with
+    model_construct() from trusted rows serialize without complaint.
+    """
+    return Response(
+        model.model_dump_json(warnings=False),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+async def stream_json_array(
+    rows: AsyncIterator[Mapping[Any, Any]],
+) -> AsyncIterator[bytes]:
+    """
+    Encode rows as a JSON array, one element per chunk.
+    """
+    separator = b"["
+    
+    async for row in rows:
+        yield separator + orjson.dumps(dict(row))
+        separator = b","
+    
+    yield b"[]" if separator == b"[" else b"]"
@@ -1,14 +1,23 @@
 # performance/locustfile.py
 from typing import Dict, List, Optional
 
-import json
+import itertools
+import logging
+import os
 import random
+from collections import deque
+from queue import Empty, Queue
 from uuid import uuid4
 
-from locust import HttpUser, TaskSet, between, task
+import httpx
+import orjson
 
-# Sample test data
-TEST_USERNAMES = [f"testuser_{i}" for i in range(1, 11)]
+from locust import FastHttpUser, TaskSet, between, events, task
+from locust.runners import MasterRunner
+
+# Sample test data. Registered users are cycled into a fixed-size ring, so
+# the working set stays constant however long the test runs.
+TEST_USERNAMES = deque((f"testuser_{i}" for i in range(1, 11)), maxlen=256)
 TEST_PASSWORDS = "testpassword123"
 TEST_ITEM_NAMES = [
     "Laptop", "Smartphone", "Headphones", "Monitor", "Keyboard", 
@@ -20,32 +29,154 @@ TEST_ITEM_DESCRIPTIONS = [
     "Most popular", "New release", "Limited edition"
 ]
 
+# Random payload fields are drawn once at import; tasks step through them
+# instead of calling random on every request
+DRAW_POOL_SIZE = 100_000
+DRAWN_ITEM_NAMES = random.choices(TEST_ITEM_NAMES, k=DRAW_POOL_SIZE)
+DRAWN_ITEM_DESCRIPTIONS = random.choices(TEST_ITEM_DESCRIPTIONS, k=DRAW_POOL_SIZE)
+DRAWN_ITEM_PRICES = [
+    round(random.uniform(10.0, 1000.0), 2) for _ in range(DRAW_POOL_SIZE)
+]
+
+# Greenlets switch only on I/O, so they can share one counter
+_draws = itertools.count()
+
+
+def next_draw() -> int:
+    """Index of the next pre-drawn set of payload fields."""
+    return next(_draws) % DRAW_POOL_SIZE
+
+
+def pick_username() -> str:
+    """A known username, chosen with the next draw index."""
+    return TEST_USERNAMES[next_draw() % len(TEST_USERNAMES)]
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Users registered and logged in before the test starts, so spawning
+# simulated users doesn't flood the auth endpoints during ramp-up. The API
+# allows 10 logins per minute per client IP (and 100 unauthenticated
+# requests overall), so the default stays well inside that. For a larger
+# pool, run the target with RATE_LIMIT_ENABLED=false and raise
+# LOCUST_AUTH_POOL_SIZE.
+AUTH_POOL_SIZE = int(os.environ.get("LOCUST_AUTH_POOL_SIZE", "5"))
+
+
+def auth_headers(token: str) -> Dict[str, str]:
+    """JSON and bearer headers, built once per user and sent on each request."""
+    return {**JSON_HEADERS, "Authorization": f"Bearer {token}"}
+
+
+def send_json(
+    client,
+    method: str,
+    path: str,
+    payload: Dict,
+    name: Optional[str] = None,
+    headers: Dict[str, str] = JSON_HEADERS,
+):
+    """
+    Send a JSON body encoded with orjson instead of the stdlib encoder.
+    
+    `name` groups requests to per-ID URLs under one row in the stats.
+    """
+    return client.request(
+        method,
+        path,
+        data=orjson.dumps(payload),
+        headers=headers,
+        name=name or path,
+    )
+
+
+@events.test_start.add_listener
+def prewarm_auth_pool(environment, **kwargs):
+    """
+    Fill the worker's pool of (username, token) pairs once per test.
+    
+    Stops at the first 429, leaving the rest of the users to login on
+    start, rather than draining the rate limit before measurement begins.
+    """
+    environment.auth_pool = Queue()
+    
+    # The master only coordinates; its workers fill their own pools
+    if isinstance(environment.runner, MasterRunner):
+        return
+    
+    host = environment.host or WebsiteUser.host
+    
+    with httpx.Client(base_url=host, headers=JSON_HEADERS) as client:
+        for _ in range(AUTH_POOL_SIZE):
+            username = f"loadtest_{uuid4().hex[:8]}"
+            credentials = {"username": username, "password": TEST_PASSWORDS}
+            
+            response = client.post(
+                "/api/v1/auth/register",
+                content=orjson.dumps({
+                    **credentials,
+                    "email": f"{username}@example.com",
+                    "full_name": f"Load Test User {username}",
+                }),
+            )
+            if response.status_code == 429:
+                break
+            if response.status_code != 201:
+                continue
+            
+            response = client.post(
+                "/api/v1/auth/login", content=orjson.dumps(credentials)
+            )
+            if response.status_code == 429:
+                break
+            if response.status_code == 200:
+                token = orjson.loads(response.content)["access_token"]
+                environment.auth_pool.put((username, token))
+                TEST_USERNAMES.append(username)
+    
+    pooled = environment.auth_pool.qsize()
+    if pooled < AUTH_POOL_SIZE:
+        logging.warning(
+            f"Prewarmed {pooled} of {AUTH_POOL_SIZE} auth tokens; "
+            "the target may be rate limiting (see RATE_LIMIT_ENABLED)"
+        )
+
 
 class ItemBehavior(TaskSet):
     """
     TaskSet for item-related operations.
     """
     def on_start(self):
-        """Login before starting item operations."""
-        self.login()
+        """Take a prewarmed token, or login once the pool runs dry."""
         self.item_ids = []
+        self.headers = JSON_HEADERS
+        
+        try:
+            self.username, self.token = self.user.environment.auth_pool.get_nowait()
+        except (AttributeError, Empty):
+            self.login()
+            return
+        
+        self.headers = auth_headers(self.token)
     
     def login(self):
         """Login to get access token."""
-        username = random.choice(TEST_USERNAMES)
+        username = pick_username()
         
-        response = self.client.post(
+        response = send_json(
+            self.client,
+            "POST",
             "/api/v1/auth/login",
-            json={
+            {
                 "username": username,
                 "password": TEST_PASSWORDS,
             },
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             self.token = data["access_token"]
-            self.client.headers.update({"Authorization": f"Bearer {self.token}"})
+            self.headers = auth_headers(self.token)
             self.username = username
         else:
             # Register if login fails
@@ -56,9 +187,11 @@ class ItemBehavior(TaskSet):
         username = f"loadtest_{uuid4().hex[:8]}"
         
         # Register
-        response = self.client.post(
+        response = send_json(
+            self.client,
+            "POST",
             "/api/v1/auth/register",
-            json={
+            {
                 "username": username,
                 "email": f"{username}@example.com",
                 "password": TEST_PASSWORDS,
@@ -68,39 +201,44 @@ class ItemBehavior(TaskSet):
         
         if response.status_code == 201:
             # Login
-            response = self.client.post(
+            response = send_json(
+                self.client,
+                "POST",
                 "/api/v1/auth/login",
-                json={
+                {
                     "username": username,
                     "password": TEST_PASSWORDS,
                 },
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.token = data["access_token"]
-                self.client.headers.update({"Authorization": f"Bearer {self.token}"})
+                self.headers = auth_headers(self.token)
                 self.username = username
                 TEST_USERNAMES.append(username)
     
     @task(2)
     def get_items(self):
         """Get list of items."""
-        self.client.get("/api/v1/items")
+        self.client.get("/api/v1/items", headers=self.headers)
     
     @task(1)
     def create_item(self):
         """Create a new item."""
+        i = next_draw()
         item_data = {
-            "name": random.choice(TEST_ITEM_NAMES),
-            "description": random.choice(TEST_ITEM_DESCRIPTIONS),
-            "price": round(random.uniform(10.0, 1000.0), 2),
+            "name": DRAWN_ITEM_NAMES[i],
+            "description": DRAWN_ITEM_DESCRIPTIONS[i],
+            "price": DRAWN_ITEM_PRICES[i],
         }
         
-        response = self.client.post("/api/v1/items", json=item_data)
+        response = send_json(
+            self.client, "POST", "/api/v1/items", item_data, headers=self.headers
+        )
         
         if response.status_code == 201:
-            data = response.json()
+            data = orjson.loads(response.content)
             self.item_ids.append(data["id"])
     
     @task(3)
@@ -108,7 +246,11 @@ class ItemBehavior(TaskSet):
         """Get a specific item."""
         if self.item_ids:
             item_id = random.choice(self.item_ids)
-            self.client.get(f"/api/v1/items/{item_id}")
+            self.client.get(
+                f"/api/v1/items/{item_id}",
+                name="/api/v1/items/[id]",
+                headers=self.headers,
+            )
     
     @task(1)
     def update_item(self):
@@ -116,12 +258,20 @@ class ItemBehavior(TaskSet):
         if self.item_ids:
             item_id = random.choice(self.item_ids)
             
+            i = next_draw()
             item_data = {
-                "name": f"Updated {random.choice(TEST_ITEM_NAMES)}",
-                "price": round(random.uniform(10.0, 1000.0), 2),
+                "name": f"Updated {DRAWN_ITEM_NAMES[i]}",
+                "price": DRAWN_ITEM_PRICES[i],
             }
             
-            self.client.put(f"/api/v1/items/{item_id}", json=item_data)
+            send_json(
+                self.client,
+                "PUT",
+                f"/api/v1/items/{item_id}",
+                item_data,
+                name="/api/v1/items/[id]",
+                headers=self.headers,
+            )
     
     @task(1)
     def delete_item(self):
@@ -129,7 +279,11 @@ class ItemBehavior(TaskSet):
         if self.item_ids:
             item_id = random.choice(self.item_ids)
             
-            response = self.client.delete(f"/api/v1/items/{item_id}")
+            response = self.client.delete(
+                f"/api/v1/items/{item_id}",
+                name="/api/v1/items/[id]",
+                headers=self.headers,
+            )
             
             if response.status_code == 200:
                 self.item_ids.remove(item_id)
@@ -142,11 +296,13 @@ class AuthBehavior(TaskSet):
     @task(3)
     def login(self):
         """Login task."""
-        username = random.choice(TEST_USERNAMES)
+        username = pick_username()
         
-        self.client.post(
+        send_json(
+            self.client,
+            "POST",
             "/api/v1/auth/login",
-            json={
+            {
                 "username": username,
                 "password": TEST_PASSWORDS,
             },
@@ -157,9 +313,11 @@ class AuthBehavior(TaskSet):
         """Register task."""
         username = f"loadtest_{uuid4().hex[:8]}"
         
-        response = self.client.post(
+        response = send_json(
+            self.client,
+            "POST",
             "/api/v1/auth/register",
-            json={
+            {
                 "username": username,
                 "email": f"{username}@example.com",
                 "password": TEST_PASSWORDS,
@@ -171,11 +329,17 @@ class AuthBehavior(TaskSet):
             TEST_USERNAMES.append(username)
 
 
-class WebsiteUser(HttpUser):
+class WebsiteUser(FastHttpUser):
     """
     Simulated user for load testing.
+    
+    Uses the geventhttpclient-based FastHttpUser, so one load generator can
+    send several times more requests than with the requests-based client.
     """
     host = "http://localhost:8000"
+    network_timeout = 30.0
+    connection_timeout = 10.0
+    max_retries = 1
     wait_time = between(1, 3)
     tasks = {
         ItemBehavior: 3,
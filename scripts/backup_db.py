@@ -1,24 +1,62 @@
 
 # scripts/backup_db.py
-import asyncio
 import os
+import shutil
 import subprocess
 import time
 from datetime import datetime
-from typing import Optional
+from typing import BinaryIO, Dict, List, Optional
 
 import typer
 from sqlalchemy import text
 
 from app.core.config import settings, DatabaseType
 
+try:
+    # uvloop's event loop has less per-task overhead than asyncio's own
+    from uvloop import run as run_async
+except ImportError:
+    from asyncio import run as run_async
+
 app = typer.Typer()
 
 
+def _gzip_cmd(*args: str) -> List[str]:
+    """gzip command line, using pigz's parallel compression when installed."""
+    if shutil.which("pigz"):
+        return ["pigz", "-p", str(os.cpu_count() or 1), *args]
+    return ["gzip", *args]
+
+
+def _pipe(
+    producer: List[str],
+    consumer: List[str],
+    env: Optional[Dict[str, str]] = None,
+    stdout: Optional[BinaryIO] = None,
+) -> None:
+    """
+    Run `producer | consumer` without a shell or an intermediate file.
+    
+    Raises CalledProcessError if either side fails.
+    """
+    first = subprocess.Popen(producer, env=env, stdout=subprocess.PIPE)
+    second = subprocess.Popen(consumer, env=env, stdin=first.stdout, stdout=stdout)
+    # Let the producer see SIGPIPE if the consumer exits early
+    first.stdout.close()
+    
+    for process, cmd in ((second, consumer), (first, producer)):
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
 @app.command()
 def backup(
     output_dir: str = typer.Option("./backups", help="Directory to store backups"),
     compress: bool = typer.Option(True, help="Compress the backup file"),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        help="Parallel pg_dump jobs; 1 writes a single plain SQL file instead",
+    ),
 ):
     """Backup the database."""
     now = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -34,8 +72,6 @@ def backup(
             f"--port={settings.POSTGRES_PORT}",
             f"--username={settings.POSTGRES_USER}",
             f"--dbname={settings.POSTGRES_DB}",
-            "--format=plain",
-            f"--file={backup_file}",
         ]
         
         # Set password environment variable
@@ -43,15 +79,40 @@ def backup(
         env["PGPASSWORD"] = settings.POSTGRES_PASSWORD
         
         try:
-            # Execute pg_dump
-            subprocess.run(cmd, env=env, check=True)
-            print(f"Backup created: {backup_file}")
-            
-            # Compress the backup if requested
-            if compress:
+            if jobs > 1:
+                # Directory format dumps tables in parallel and can be
+                # restored in parallel by pg_restore. Each job compresses its
+                # own table files, so no separate compression pass is needed.
+                backup_dir = f"{output_dir}/postgres_backup_{now}"
+                subprocess.run(
+                    cmd + [
+                        "--format=directory",
+                        f"--jobs={jobs}",
+                        f"--compress={1 if compress else 0}",
+                        f"--file={backup_dir}",
+                    ],
+                    env=env,
+                    check=True,
+                )
+                print(f"Backup created: {backup_dir}")
+            elif compress:
+                # Compress the dump as it is written, instead of writing the
+                # plain SQL to disk and then reading it back through gzip.
+                # Level 1 is several times faster for a modestly larger file.
                 compressed_file = f"{backup_file}.gz"
-                subprocess.run(["gzip", backup_file], check=True)
-                print(f"Backup compressed: {compressed_file}")
+                with open(compressed_file, "wb") as out:
+                    _pipe(
+                        cmd + ["--format=plain"], _gzip_cmd("-1"), env=env, stdout=out
+                    )
+                print(f"Backup created: {compressed_file}")
+            else:
+                # Execute pg_dump
+                subprocess.run(
+                    cmd + ["--format=plain", f"--file={backup_file}"],
+                    env=env,
+                    check=True,
+                )
+                print(f"Backup created: {backup_file}")
         except subprocess.CalledProcessError as e:
             print(f"Backup failed: {e}")
     elif settings.DATABASE_TYPE == DatabaseType.ORACLE:
@@ -92,15 +153,15 @@ def backup(
 
 @app.command()
 def restore(
-    backup_file: str = typer.Argument(..., help="Backup file to restore"),
+    backup_file: str = typer.Argument(..., help="Backup file or directory to restore"),
     drop_existing: bool = typer.Option(False, help="Drop existing database before restore"),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        help="Parallel pg_restore jobs for directory-format backups",
+    ),
 ):
     """Restore the database from a backup."""
-    # Uncompress the backup file if it's compressed
-    if backup_file.endswith(".gz"):
-        uncompressed_file = backup_file[:-3]
-        subprocess.run(["gunzip", "-c", backup_file, ">", uncompressed_file], shell=True, check=True)
-        backup_file = uncompressed_file
+    compressed = backup_file.endswith(".gz")
     
     if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
         # Build psql command
@@ -131,16 +192,34 @@ def restore(
                 )
                 print(f"Database {settings.POSTGRES_DB} recreated")
             
-            # Execute psql to restore
-            subprocess.run(
-                cmd + ["-f", backup_file],
-                env=env,
-                check=True,
-            )
+            # Directory-format dumps go through pg_restore in parallel; plain
+            # dumps run through psql, decompressed straight into it without
+            # an uncompressed copy on disk
+            if os.path.isdir(backup_file):
+                subprocess.run(
+                    ["pg_restore", *cmd[1:], f"--jobs={jobs}", backup_file],
+                    env=env,
+                    check=True,
+                )
+            elif compressed:
+                _pipe(_gzip_cmd("-dc", backup_file), cmd + ["-f", "-"], env=env)
+            else:
+                subprocess.run(
+                    cmd + ["-f", backup_file],
+                    env=env,
+                    check=True,
+                )
             print(f"Backup restored from: {backup_file}")
         except subprocess.CalledProcessError as e:
             print(f"Restore failed: {e}")
     elif settings.DATABASE_TYPE == DatabaseType.ORACLE:
+        # impdp needs the dump as a file, so uncompress it next to the backup
+        if compressed:
+            uncompressed_file = backup_file[:-3]
+            with open(uncompressed_file, "wb") as out:
+                subprocess.run(_gzip_cmd("-dc", backup_file), stdout=out, check=True)
+            backup_file = uncompressed_file
+        
         # Build impdp command
         cmd = [
             "impdp",
@@ -171,7 +250,7 @@ def restore(
 @app.command()
 def clear_db():
     """Clear all data in the database."""
-    asyncio.run(_clear_db())
+    run_async(_clear_db())
 
 
 async def _clear_db():
@@ -182,14 +261,12 @@ async def _clear_db():
     
     async with engine.begin() as conn:
         if settings.DATABASE_TYPE == DatabaseType.POSTGRES:
-            # Disable foreign key checks
-            await conn.execute(text("SET session_replication_role = 'replica';"))
-            
-            # Truncate all tables
-            await conn.execute(text("TRUNCATE TABLE item, \"user\" RESTART IDENTITY CASCADE;"))
-            
-            # Re-enable foreign key checks
-            await conn.execute(text("SET session_replication_role = 'origin';"))
+            # Truncate all tables in one statement. Foreign keys between
+            # tables truncated together don't block it, so there is no need
+            # to switch session_replication_role around it.
+            await conn.execute(
+                text("TRUNCATE TABLE item, \"user\" RESTART IDENTITY CASCADE")
+            )
         elif settings.DATABASE_TYPE == DatabaseType.ORACLE:
             # Truncate all tables
             await conn.execute(text("TRUNCATE TABLE item"))
@@ -2,18 +2,30 @@
 # scripts/create_dummy_data.py
 import asyncio
 import random
-from typing import List, Optional
+from typing import Awaitable, List, Optional, TypeVar
 from uuid import UUID
 
 import httpx
+import orjson
 import typer
 from pydantic import BaseModel, EmailStr
 
+try:
+    # uvloop's event loop has less per-task overhead than asyncio's own
+    from uvloop import run as run_async
+except ImportError:
+    from asyncio import run as run_async
+
 app = typer.Typer()
 
 # Base URL
 API_BASE_URL = "http://localhost:8000/api/v1"
 
+# Requests in flight at once
+CONCURRENCY = 32
+
+T = TypeVar("T")
+
 # Sample data
 USERS = [
     {"username": "admin", "email": "admin@example.com", "password": "adminpassword", "is_superuser": True},
@@ -37,6 +49,18 @@ ITEMS = [
     {"name": "Speaker", "description": "Bluetooth portable speaker", "price": 149.99},
 ]
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies for the fixed sample data, encoded once with orjson
+USER_BODIES = {user["username"]: orjson.dumps(user) for user in USERS}
+LOGIN_BODIES = {
+    (user["username"], user["password"]): orjson.dumps(
+        {"username": user["username"], "password": user["password"]}
+    )
+    for user in USERS
+}
+ITEM_BODIES = {item["name"]: orjson.dumps(item) for item in ITEMS}
+
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -60,13 +84,15 @@ class ItemCreate(BaseModel):
 async def register_user(client: httpx.AsyncClient, user_data: dict) -> Optional[dict]:
     """Register a new user."""
     try:
+        body = USER_BODIES.get(user_data["username"]) or orjson.dumps(user_data)
         response = await client.post(
-            f"{API_BASE_URL}/auth/register",
-            json=user_data,
+            "/auth/register",
+            content=body,
+            headers=JSON_HEADERS,
         )
         
         if response.status_code == 201:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             print(f"Failed to register user {user_data['username']}: {response.text}")
             return None
@@ -78,16 +104,18 @@ async def register_user(client: httpx.AsyncClient, user_data: dict) -> Optional[
 async def login_user(client: httpx.AsyncClient, username: str, password: str) -> Optional[str]:
     """Login and get access token."""
     try:
+        body = LOGIN_BODIES.get((username, password)) or orjson.dumps({
+            "username": username,
+            "password": password,
+        })
         response = await client.post(
-            f"{API_BASE_URL}/auth/login",
-            json={
-                "username": username,
-                "password": password,
-            },
+            "/auth/login",
+            content=body,
+            headers=JSON_HEADERS,
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             return data["access_token"]
         else:
             print(f"Failed to login as {username}: {response.text}")
@@ -104,14 +132,15 @@ async def create_item(
 ) -> Optional[dict]:
     """Create a new item."""
     try:
+        body = ITEM_BODIES.get(item_data["name"]) or orjson.dumps(item_data)
         response = await client.post(
-            f"{API_BASE_URL}/items",
-            json=item_data,
-            headers={"Authorization": f"Bearer {token}"},
+            "/items",
+            content=body,
+            headers={**JSON_HEADERS, "Authorization": f"Bearer {token}"},
         )
         
         if response.status_code == 201:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             print(f"Failed to create item {item_data['name']}: {response.text}")
             return None
@@ -124,39 +153,79 @@ async def create_item(
 def create_data(
     num_users: int = typer.Option(len(USERS), help="Number of users to create"),
     num_items_per_user: int = typer.Option(5, help="Number of items per user"),
+    api_base_url: str = typer.Option(API_BASE_URL, help="Base URL of the API"),
 ):
     """Create dummy data for testing."""
-    asyncio.run(_create_data(num_users, num_items_per_user))
+    run_async(_create_data(num_users, num_items_per_user, api_base_url))
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro: Awaitable[T]) -> T:
+    """Await a coroutine once the semaphore lets it through."""
+    async with semaphore:
+        return await coro
 
 
-async def _create_data(num_users: int, num_items_per_user: int):
+async def _create_data(
+    num_users: int, num_items_per_user: int, api_base_url: str = API_BASE_URL
+):
     """Async implementation of create_data."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    # Requests run concurrently, up to one per pooled connection. Idle
+    # connections are kept between the phases instead of reconnecting.
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    limits = httpx.Limits(
+        max_connections=CONCURRENCY,
+        max_keepalive_connections=CONCURRENCY,
+        keepalive_expiry=60,
+    )
+    
+    # HTTP/2 is negotiated over TLS only, e.g. through the Caddy proxy;
+    # plain http:// to uvicorn stays on HTTP/1.1 with keep-alive. Connect
+    # errors are retried a couple of times before a request fails.
+    async with httpx.AsyncClient(
+        base_url=api_base_url,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=2),
+    ) as client:
         # Register users
         print("Registering users...")
+        candidates = USERS[:num_users]
+        registered = await asyncio.gather(
+            *(_bounded(semaphore, register_user(client, user)) for user in candidates)
+        )
+        
         users = []
-        for i in range(min(num_users, len(USERS))):
-            user = await register_user(client, USERS[i])
-            if user:
-                users.append(USERS[i])
-                print(f"Registered user: {USERS[i]['username']}")
+        for user, result in zip(candidates, registered, strict=True):
+            if result:
+                users.append(user)
+                print(f"Registered user: {user['username']}")
         
         # Create items for each user
         print("\nCreating items...")
-        for user in users:
-            # Login as user
-            token = await login_user(client, user["username"], user["password"])
-            
-            if token:
-                print(f"\nCreating items for user: {user['username']}")
-                
-                # Create items
-                for _ in range(num_items_per_user):
-                    item_data = random.choice(ITEMS)
-                    item = await create_item(client, item_data, token)
-                    
-                    if item:
-                        print(f"Created item: {item_data['name']}")
+        tokens = await asyncio.gather(
+            *(
+                _bounded(
+                    semaphore, login_user(client, user["username"], user["password"])
+                )
+                for user in users
+            )
+        )
+        
+        jobs = [
+            (user, random.choice(ITEMS), token)
+            for user, token in zip(users, tokens, strict=True)
+            if token
+            for _ in range(num_items_per_user)
+        ]
+        items = await asyncio.gather(
+            *(
+                _bounded(semaphore, create_item(client, item_data, token))
+                for _, item_data, token in jobs
+            )
+        )
+        
+        for (user, item_data, _), item in zip(jobs, items, strict=True):
+            if item:
+                print(f"Created item for {user['username']}: {item_data['name']}")
         
         print("\nDummy data creation completed!")
 
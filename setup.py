@@ -6,234 +6,19 @@ This script creates the directory structure and empty files
 for the FastAPI boilerplate project.
 """
 
+import argparse
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from pathlib import Path, PurePosixPath
 
+# Creating a path mostly waits on the filesystem, which threads can overlap
+MAX_WORKERS = 16
 
-class TerminalColors:
-    """Terminal colors for prettier output."""
-    GREEN = '\033[92m'
-    BLUE = '\033[94m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    END = '\033[0m'
-
-
-def print_colored(text, color):
-    """Print colored text to the terminal."""
-    print(f"{color}{text}{TerminalColors.END}")
-
-
-def create_directory(path):
-    """Create a directory if it doesn't exist."""
-    if not os.path.exists(path):
-        os.makedirs(path)
-        print_colored(f"Created directory: {path}", TerminalColors.GREEN)
-    else:
-        print_colored(f"Directory already exists: {path}", TerminalColors.YELLOW)
-
-
-def create_file(path):
-    """Create an empty file if it doesn't exist."""
-    if not os.path.exists(path):
-        with open(path, 'w') as f:
-            pass  # Create an empty file
-        print_colored(f"Created file: {path}", TerminalColors.GREEN)
-    else:
-        print_colored(f"File already exists: {path}", TerminalColors.YELLOW)
-
-
-def create_file_with_content(path, content):
-    """Create a file with content if it doesn't exist."""
-    if not os.path.exists(path):
-        with open(path, 'w') as f:
-            f.write(content)
-        print_colored(f"Created file with content: {path}", TerminalColors.GREEN)
-    else:
-        print_colored(f"File already exists: {path}", TerminalColors.YELLOW)
-
-
-def main():
-    """Main function to create the project structure."""
-    # Project root directory (current directory)
-    root_dir = os.getcwd()
-    
-    # Confirm before proceeding
-    print_colored("This script will create the folder structure and files for the FastAPI boilerplate.", TerminalColors.BLUE)
-    print_colored("It will not overwrite existing files.", TerminalColors.YELLOW)
-    
-    response = input("Continue? (y/n): ")
-    if response.lower() != 'y':
-        print_colored("Aborted.", TerminalColors.RED)
-        sys.exit(1)
-    
-    print_colored("\nCreating project structure for: fastapi-boilerplate\n", TerminalColors.BLUE)
-    
-    # Create directory structure
-    directories = [
-        # App structure
-        "app",
-        "app/core",
-        "app/api",
-        "app/api/v1",
-        "app/api/v1/items",
-        "app/api/v1/auth",
-        "app/services",
-        "app/models",
-        "app/db",
-        "app/db/migrations",
-        "app/db/migrations/versions",
-        "app/utils",
-        
-        # Docker files
-        "docker",
-        "docker/api",
-        "docker/caddy",
-        
-        # Deployment files
-        "deployment",
-        "deployment/k8s",
-        "deployment/helm",
-        
-        # Other directories
-        "performance",
-        "scripts",
-        "tests",
-        "tests/api",
-        "tests/core",
-        "tests/services",
-        "tests/utils",
-        "logs",
-        "backups",
-    ]
-    
-    # Create directories
-    for directory in directories:
-        create_directory(os.path.join(root_dir, directory))
-    
-    # Define files to create
-    files = [
-        # App core files
-        "app/__init__.py",
-        "app/main.py",
-        "app/core/__init__.py",
-        "app/core/config.py",
-        "app/core/db.py",
-        "app/core/exceptions.py",
-        "app/core/logging.py",
-        "app/core/security.py",
-        
-        # API structure
-        "app/api/__init__.py",
-        "app/api/deps.py",
-        "app/api/router.py",
-        "app/api/v1/__init__.py",
-        
-        # Items module
-        "app/api/v1/items/__init__.py",
-        "app/api/v1/items/models.py",
-        "app/api/v1/items/router.py",
-        "app/api/v1/items/schemas.py",
-        "app/api/v1/items/service.py",
-        "app/api/v1/items/utils.py",
-        
-        # Auth module
-        "app/api/v1/auth/__init__.py",
-        "app/api/v1/auth/models.py",
-        "app/api/v1/auth/router.py",
-        "app/api/v1/auth/schemas.py",
-        "app/api/v1/auth/service.py",
-        "app/api/v1/auth/utils.py",
-        
-        # Services
-        "app/services/__init__.py",
-        "app/services/cache.py",
-        "app/services/minio.py",
-        "app/services/ratelimit.py",
-        "app/services/redis.py",
-        
-        # Models
-        "app/models/__init__.py",
-        "app/models/base.py",
-        
-        # Database files
-        "app/db/__init__.py",
-        "app/db/base.py",
-        "app/db/factories.py",
-        "app/db/migrations/env.py",
-        "app/db/migrations/README",
-        "app/db/migrations/script.py.mako",
-        "app/db/migrations/versions/.gitkeep",
-        
-        # Utils
-        "app/utils/__init__.py",
-        "app/utils/common.py",
-        
-        # Docker files
-        "docker/api/Dockerfile",
-        "docker/caddy/Caddyfile",
-        
-        # Deployment files
-        "deployment/k8s/api-deployment.yaml",
-        "deployment/k8s/api-service.yaml",
-        "deployment/k8s/caddy-configmap.yaml",
-        "deployment/k8s/caddy-deployment.yaml",
-        "deployment/k8s/caddy-pvc.yaml",
-        "deployment/k8s/caddy-service.yaml",
-        "deployment/k8s/configmap.yaml",
-        "deployment/k8s/ingress.yaml",
-        "deployment/k8s/minio-deployment.yaml",
-        "deployment/k8s/minio-pvc.yaml",
-        "deployment/k8s/minio-service.yaml",
-        "deployment/k8s/namespace.yaml",
-        "deployment/k8s/postgres-deployment.yaml",
-        "deployment/k8s/postgres-pvc.yaml",
-        "deployment/k8s/postgres-service.yaml",
-        "deployment/k8s/redis-deployment.yaml",
-        "deployment/k8s/redis-pvc.yaml",
-        "deployment/k8s/redis-service.yaml",
-        "deployment/k8s/secrets.yaml",
-        "deployment/helm/.gitkeep",
-        
-        # Performance test files
-        "performance/locustfile.py",
-        
-        # Scripts
-        "scripts/create_dummy_data.py",
-        "scripts/backup_db.py",
-        "scripts/generate_models.py",
-        
-        # Test files
-        "tests/__init__.py",
-        "tests/conftest.py",
-        "tests/api/__init__.py",
-        "tests/api/test_items.py",
-        "tests/api/test_auth.py",
-        "tests/core/__init__.py",
-        "tests/core/test_config.py",
-        "tests/services/__init__.py",
-        "tests/services/test_cache.py",
-        "tests/utils/__init__.py",
-        
-        # Configuration files
-        ".env.local",
-        ".env.prod",
-        "docker-compose.db.yml",
-        "docker-compose.yml",
-        "pyproject.toml",
-        "uvproject.toml",
-        "alembic.ini",
-        "Makefile",
-        ".gitignore",
-    ]
-    
-    # Create empty files
-    for file in files:
-        create_file(os.path.join(root_dir, file))
-    
-    # Create files with content
-    gitignore_content = """# Python
+# Contents of the files created with content, as bytes so they are
+# written without an encoding step
+GITIGNORE_CONTENT = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -298,8 +83,8 @@ backups/
 *kubeconfig*
 *kube-config*
 """
-    
-    readme_content = """# FastAPI Boilerplate
+
+README_CONTENT = b"""# FastAPI Boilerplate
 
 A production-ready FastAPI boilerplate with PostgreSQL, Redis, MinIO, and more.
 
@@ -337,9 +122,390 @@ API documentation is available at:
 - Swagger UI: http://localhost:8000/docs
 - ReDoc: http://localhost:8000/redoc
 """
+
+# Files created with content, relative to the project root
+CONTENT_FILES = {
+    ".gitignore": GITIGNORE_CONTENT,
+    "README.md": README_CONTENT,
+}
+
+# Files to create, relative to the project root
+FILES = [
+    # App core files
+    "app/__init__.py",
+    "app/main.py",
+    "app/core/__init__.py",
+    "app/core/config.py",
+    "app/core/db.py",
+    "app/core/exceptions.py",
+    "app/core/logging.py",
+    "app/core/security.py",
+    
+    # API structure
+    "app/api/__init__.py",
+    "app/api/deps.py",
+    "app/api/router.py",
+    "app/api/v1/__init__.py",
+    
+    # Items module
+    "app/api/v1/items/__init__.py",
+    "app/api/v1/items/models.py",
+    "app/api/v1/items/router.py",
+    "app/api/v1/items/schemas.py",
+    "app/api/v1/items/service.py",
+    "app/api/v1/items/utils.py",
+    
+    # Auth module
+    "app/api/v1/auth/__init__.py",
+    "app/api/v1/auth/models.py",
+    "app/api/v1/auth/router.py",
+    "app/api/v1/auth/schemas.py",
+    "app/api/v1/auth/service.py",
+    "app/api/v1/auth/utils.py",
+    
+    # Services
+    "app/services/__init__.py",
+    "app/services/cache.py",
+    "app/services/minio.py",
+    "app/services/ratelimit.py",
+    "app/services/redis.py",
+    
+    # Models
+    "app/models/__init__.py",
+    "app/models/base.py",
+    
+    # Database files
+    "app/db/__init__.py",
+    "app/db/base.py",
+    "app/db/factories.py",
+    "app/db/migrations/env.py",
+    "app/db/migrations/README",
+    "app/db/migrations/script.py.mako",
+    "app/db/migrations/versions/.gitkeep",
+    
+    # Utils
+    "app/utils/__init__.py",
+    "app/utils/common.py",
+    
+    # Docker files
+    "docker/api/Dockerfile",
+    "docker/caddy/Caddyfile",
+    
+    # Deployment files
+    "deployment/k8s/api-deployment.yaml",
+    "deployment/k8s/api-service.yaml",
+    "deployment/k8s/caddy-configmap.yaml",
+    "deployment/k8s/caddy-deployment.yaml",
+    "deployment/k8s/caddy-pvc.yaml",
+    "deployment/k8s/caddy-service.yaml",
+    "deployment/k8s/configmap.yaml",
+    "deployment/k8s/ingress.yaml",
+    "deployment/k8s/minio-deployment.yaml",
+    "deployment/k8s/minio-pvc.yaml",
+    "deployment/k8s/minio-service.yaml",
+    "deployment/k8s/namespace.yaml",
+    "deployment/k8s/postgres-deployment.yaml",
+    "deployment/k8s/postgres-pvc.yaml",
+    "deployment/k8s/postgres-service.yaml",
+    "deployment/k8s/redis-deployment.yaml",
+    "deployment/k8s/redis-pvc.yaml",
+    "deployment/k8s/redis-service.yaml",
+    "deployment/k8s/secrets.yaml",
+    "deployment/helm/.gitkeep",
+    
+    # Performance test files
+    "performance/locustfile.py",
+    
+    # Scripts
+    "scripts/create_dummy_data.py",
+    "scripts/backup_db.py",
+    "scripts/generate_models.py",
+    
+    # Test files
+    "tests/__init__.py",
+    "tests/conftest.py",
+    "tests/api/__init__.py",
+    "tests/api/test_items.py",
+    "tests/api/test_auth.py",
+    "tests/core/__init__.py",
+    "tests/core/test_config.py",
+    "tests/services/__init__.py",
+    "tests/services/test_cache.py",
+    "tests/utils/__init__.py",
+    
+    # Configuration files
+    ".env.local",
+    ".env.prod",
+    "docker-compose.db.yml",
+    "docker-compose.yml",
+    "pyproject.toml",
+    "uvproject.toml",
+    "alembic.ini",
+    "Makefile",
+]
+
+# Directories that get no files of their own; all others are derived
+# from the files above
+EMPTY_DIRECTORIES = [
+    "logs",
+    "backups",
+]
+
+# Every ancestor of every file, each once, grouped by depth so each level
+# can be created in parallel once the one above it exists
+DIRECTORY_LEVELS = [
+    list(level)
+    for _, level in groupby(
+        sorted(
+            {
+                parent.as_posix()
+                for file in FILES
+                for parent in PurePosixPath(file).parents
+                if parent.name
+            }.union(EMPTY_DIRECTORIES),
+            key=lambda directory: (directory.count("/"), directory),
+        ),
+        key=lambda directory: directory.count("/"),
+    )
+]
+
+
+class TerminalColors:
+    """Terminal colors for prettier output."""
+    GREEN = '\033[92m'
+    BLUE = '\033[94m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    END = '\033[0m'
+
+
+# Colored report prefixes and line ending, built once instead of formatting
+# every line
+DIRECTORY_CREATED = TerminalColors.GREEN + "Created directory: "
+DIRECTORY_EXISTS = TerminalColors.YELLOW + "Directory already exists: "
+FILE_CREATED = TerminalColors.GREEN + "Created file: "
+FILE_WITH_CONTENT_CREATED = TerminalColors.GREEN + "Created file with content: "
+FILE_EXISTS = TerminalColors.YELLOW + "File already exists: "
+LINE_END = TerminalColors.END + "\n"
+
+
+def format_colored(text, color):
+    """Format a line of colored text for the terminal."""
+    return f"{color}{text}{TerminalColors.END}\n"
+
+
+def print_colored(text, color):
+    """Print colored text to the terminal."""
+    sys.stdout.write(format_colored(text, color))
+
+
+def scan_existing(paths):
+    """
+    List the parent directory of each path once.
+    
+    Returns a dict mapping each parent to the set of names already in it,
+    so existence checks become set lookups instead of a stat per path.
+    Parents that don't exist yet map to an empty set; parents are visited
+    top-down, so one missing from an already listed directory is known to
+    be absent without a syscall.
+    """
+    existing = {}
+    parents = sorted(
+        {path.parent for path in paths}, key=lambda parent: len(parent.parts)
+    )
+    for parent in parents:
+        grandparent = existing.get(parent.parent)
+        if grandparent is not None and parent.name not in grandparent:
+            existing[parent] = set()
+            continue
+        try:
+            with os.scandir(parent) as entries:
+                existing[parent] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing[parent] = set()
+    return existing
+
+
+def create_directory(root_dir, directory, existing, root_fd=None):
+    """
+    Create a directory if it doesn't exist; its parent must already exist.
+    
+    With `root_fd` open on `root_dir`, the directory is made relative to it.
+    Returns the report prefix and path, so calls can run on worker threads
+    and still be printed in order.
+    """
+    path = root_dir / directory
+    parent, name = path.parent, path.name
+    created = False
+    if name not in existing[parent]:
+        try:
+            if root_fd is None:
+                os.mkdir(path)
+            else:
+                os.mkdir(directory, dir_fd=root_fd)
+            created = True
+            # A directory created here starts out empty
+            existing.setdefault(path, set())
+        except FileExistsError:
+            pass
+        existing[parent].add(name)
+    
+    if created:
+        return DIRECTORY_CREATED, path
+    return DIRECTORY_EXISTS, path
+
+
+def create_file(path, existing):
+    """
+    Create an empty file if it doesn't exist.
+    
+    Returns the report prefix and path, like create_directory.
+    """
+    parent, name = path.parent, path.name
+    created = False
+    if name not in existing[parent]:
+        # O_EXCL checks and creates in one call, so a file that appeared
+        # since the scan is never truncated
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+            created = True
+        except FileExistsError:
+            pass
+        existing[parent].add(name)
+    
+    if created:
+        return FILE_CREATED, path
+    return FILE_EXISTS, path
+
+
+def create_file_with_content(path, content, existing):
+    """
+    Create a file with the given bytes if it doesn't exist.
+    
+    Returns the report prefix and path, like create_directory.
+    """
+    parent, name = path.parent, path.name
+    created = False
+    if name not in existing[parent]:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+            created = True
+        existing[parent].add(name)
+    
+    if created:
+        return FILE_WITH_CONTENT_CREATED, path
+    return FILE_EXISTS, path
+
+
+def parse_args(argv=None):
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(
+        description="Create the FastAPI boilerplate project structure."
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="skip the confirmation prompt"
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="don't report each directory and file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function to create the project structure."""
+    args = parse_args(argv)
+    
+    # Project root directory (current directory). Paths below are joined
+    # onto it once, as Path objects, and reused for every step.
+    root_dir = Path.cwd()
+    
+    # Confirm before proceeding, unless run unattended with --yes
+    if not args.yes:
+        print_colored(
+            "This script will create the folder structure and files for the "
+            "FastAPI boilerplate.",
+            TerminalColors.BLUE,
+        )
+        print_colored("It will not overwrite existing files.", TerminalColors.YELLOW)
+        
+        response = input("Continue? (y/n): ")
+        if response.lower() != 'y':
+            print_colored("Aborted.", TerminalColors.RED)
+            sys.exit(1)
+    
+    if not args.quiet:
+        print_colored(
+            "\nCreating project structure for: fastapi-boilerplate\n",
+            TerminalColors.BLUE,
+        )
+    
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    results = []
+    
+    # Create directories relative to an open handle on the root, so each one
+    # is a single mkdir with no path walk. Levels run in order so parents
+    # exist before their children are created.
+    root_fd = None
+    if os.mkdir in os.supports_dir_fd:
+        root_fd = os.open(
+            root_dir, getattr(os, "O_PATH", os.O_RDONLY) | os.O_DIRECTORY
+        )
+    
+    existing = scan_existing(
+        root_dir / directory for level in DIRECTORY_LEVELS for directory in level
+    )
+    
+    try:
+        for level in DIRECTORY_LEVELS:
+            for result in executor.map(
+                lambda directory: create_directory(
+                    root_dir, directory, existing, root_fd
+                ),
+                level,
+            ):
+                results.append(result)
+    finally:
+        if root_fd is not None:
+            os.close(root_fd)
+    
+    # Create empty files
+    file_paths = [root_dir / file for file in FILES]
+    existing.update(scan_existing(
+        path for path in file_paths if path.parent not in existing
+    ))
+    
+    # Files don't depend on each other, so the empty ones and those with
+    # content are all created at once
+    jobs = [executor.submit(create_file, path, existing) for path in file_paths]
+    jobs += [
+        executor.submit(create_file_with_content, root_dir / file, content, existing)
+        for file, content in CONTENT_FILES.items()
+    ]
+    for job in jobs:
+        results.append(job.result())
+    
+    executor.shutdown()
+    
+    if args.quiet:
+        return
     
-    create_file_with_content(os.path.join(root_dir, ".gitignore"), gitignore_content)
-    create_file_with_content(os.path.join(root_dir, "README.md"), readme_content)
+    # The report is written in one go rather than a line at a time
+    sys.stdout.write("".join([
+        piece
+        for prefix, path in results
+        for piece in (prefix, str(path), LINE_END)
+    ]))
+    sys.stdout.flush()
     
     # Success message and next steps
     print_colored("\nProject structure created successfully!", TerminalColors.GREEN)
@@ -0,0 +1,137 @@
+# tests/api/test_items.py
+import asyncio
+from typing import Any, List, cast
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.auth.models import User  # noqa: F401  (Item's relationship target)
+from app.api.v1.items import service as items_service
+from app.api.v1.items.models import Item
+from app.api.v1.items.schemas import ItemCreate, ItemUpdate
+from app.api.v1.items.service import item_service
+from app.core.config import settings
+from app.db.base import CRUDBase
+
+
+class FakeSession:
+    """Stands in for AsyncSession where only merge() is reached."""
+    
+    async def merge(self, obj: Any, load: bool = True) -> Any:
+        return obj
+
+
+@pytest.fixture
+def db() -> AsyncSession:
+    return cast(AsyncSession, FakeSession())
+
+
+@pytest.fixture
+def item_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def cleared_namespaces(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Record namespace clears instead of sending them to Redis."""
+    cleared: List[str] = []
+    
+    async def clear_cache_namespace(namespace: str) -> None:
+        cleared.append(namespace)
+    
+    monkeypatch.setattr(items_service, "clear_cache_namespace", clear_cache_namespace)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    items_service._local_rows.clear()
+    return cleared
+
+
+@pytest.fixture
+def stored_item(monkeypatch: pytest.MonkeyPatch, item_id: UUID) -> Item:
+    """Make the base CRUD methods return one item without a database."""
+    item = Item(id=item_id, name="Laptop", price=999.0)
+    
+    async def returns_item(self: CRUDBase, db: Any, **kwargs: Any) -> Any:
+        return item
+    
+    async def returns_items(self: CRUDBase, db: Any, **kwargs: Any) -> Any:
+        return [item]
+    
+    for name in ("create", "update", "delete"):
+        monkeypatch.setattr(CRUDBase, name, returns_item)
+    monkeypatch.setattr(CRUDBase, "create_many", returns_items)
+    return item
+
+
+def cache_row(item_id: UUID) -> None:
+    items_service._local_rows[item_id] = {"id": item_id, "name": "stale"}
+
+
+async def test_create_clears_item_caches(
+    db: AsyncSession, item_id: UUID, stored_item: Item, cleared_namespaces: List[str]
+) -> None:
+    cache_row(item_id)
+    
+    await item_service.create(db, obj_in=ItemCreate(name="Laptop", price=999.0))
+    
+    assert cleared_namespaces == ["items"]
+    assert item_id not in items_service._local_rows
+
+
+async def test_create_many_clears_item_caches(
+    db: AsyncSession, item_id: UUID, stored_item: Item, cleared_namespaces: List[str]
+) -> None:
+    cache_row(item_id)
+    
+    await item_service.create_many(db, objs_in=[ItemCreate(name="Laptop", price=999.0)])
+    
+    assert cleared_namespaces == ["items"]
+    assert item_id not in items_service._local_rows
+
+
+async def test_update_clears_item_caches(
+    db: AsyncSession, item_id: UUID, stored_item: Item, cleared_namespaces: List[str]
+) -> None:
+    cache_row(item_id)
+    
+    await item_service.update(db, db_obj=stored_item, obj_in=ItemUpdate(name="Tablet"))
+    
+    assert cleared_namespaces == ["items"]
+    assert item_id not in items_service._local_rows
+
+
+async def test_delete_clears_item_caches(
+    db: AsyncSession, item_id: UUID, stored_item: Item, cleared_namespaces: List[str]
+) -> None:
+    cache_row(item_id)
+    
+    await item_service.delete(db, id=item_id)
+    
+    assert cleared_namespaces == ["items"]
+    assert item_id not in items_service._local_rows
+
+
+async def test_read_racing_a_write_does_not_refill_local_cache(
+    db: AsyncSession,
+    item_id: UUID,
+    stored_item: Item,
+    cleared_namespaces: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+    
+    async def slow_get_row(self: Any, db: Any, id: UUID) -> Any:
+        fetched.set()
+        await release.wait()
+        return {"id": id, "name": "stale"}
+    
+    monkeypatch.setattr(items_service.ItemService, "_get_row", slow_get_row)
+    
+    read = asyncio.create_task(item_service.get(db, id=item_id))
+    await fetched.wait()
+    await item_service.delete(db, id=item_id)
+    release.set()
+    await read
+    
+    assert item_id not in items_service._local_rows
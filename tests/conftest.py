@@ -0,0 +1,5 @@
+# tests/conftest.py
+import os
+
+# Read no .env file, so the suite runs on the settings' defaults
+os.environ.setdefault("APP_ENV", "test")
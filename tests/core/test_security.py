@@ -0,0 +1,65 @@
+# tests/core/test_security.py
+from typing import Iterator, List
+
+import pytest
+
+from app.core import security
+from app.core.security import create_password_hash, verify_password_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_password_cache() -> Iterator[None]:
+    security._verified_passwords.clear()
+    yield
+    security._verified_passwords.clear()
+
+
+@pytest.fixture
+def hash_checks(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Record the passwords that reach the real hash check."""
+    checked: List[str] = []
+    verify_password = security.verify_password
+    
+    def counting_verify(plain_password: str, hashed_password: str) -> bool:
+        checked.append(plain_password)
+        return verify_password(plain_password, hashed_password)
+    
+    monkeypatch.setattr(security, "verify_password", counting_verify)
+    return checked
+
+
+async def test_password_cache_miss_verifies_and_caches(hash_checks: List[str]) -> None:
+    hashed = create_password_hash("correct-password")
+    
+    assert await verify_password_cached("correct-password", hashed)
+    assert hash_checks == ["correct-password"]
+    assert len(security._verified_passwords) == 1
+
+
+async def test_password_cache_hit_skips_hash_check(hash_checks: List[str]) -> None:
+    hashed = create_password_hash("correct-password")
+    
+    assert await verify_password_cached("correct-password", hashed)
+    assert await verify_password_cached("correct-password", hashed)
+    assert hash_checks == ["correct-password"]
+
+
+async def test_wrong_password_is_rejected_and_not_cached(
+    hash_checks: List[str],
+) -> None:
+    hashed = create_password_hash("correct-password")
+    
+    assert await verify_password_cached("correct-password", hashed)
+    assert not await verify_password_cached("wrong-password", hashed)
+    assert not await verify_password_cached("wrong-password", hashed)
+    assert hash_checks == ["correct-password", "wrong-password", "wrong-password"]
+    assert len(security._verified_passwords) == 1
+
+
+async def test_password_cache_is_keyed_by_hash(hash_checks: List[str]) -> None:
+    old_hash = create_password_hash("correct-password")
+    new_hash = create_password_hash("new-password")
+    
+    assert await verify_password_cached("correct-password", old_hash)
+    assert not await verify_password_cached("correct-password", new_hash)
+    assert hash_checks == ["correct-password", "correct-password"]
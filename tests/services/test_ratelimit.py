@@ -0,0 +1,87 @@
+# tests/services/test_ratelimit.py
+from typing import Tuple
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import settings
+from app.services.ratelimit import RateLimiter, RateLimitMiddleware
+
+
+class FixedLimiter(RateLimiter):
+    """A limiter that gives the same answer to every check."""
+    
+    def __init__(self, limited: bool, used: int, limit: int = 100) -> None:
+        super().__init__(requests=limit)
+        self.result = (limited, used, limit)
+    
+    async def is_rate_limited(self, key: str) -> Tuple[bool, int, int]:
+        return self.result
+
+
+class UnreachableLimiter(RateLimiter):
+    """A limiter whose Redis is down."""
+    
+    async def is_rate_limited(self, key: str) -> Tuple[bool, int, int]:
+        raise RedisConnectionError("Redis is down")
+
+
+def build_app(limiter: RateLimiter) -> RateLimitMiddleware:
+    """An app wrapped in RateLimitMiddleware, checking with the given limiter."""
+    app = FastAPI()
+    
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+    
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+    
+    middleware = RateLimitMiddleware(app)
+    middleware.limiter = limiter
+    return middleware
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+
+
+async def get(app: RateLimitMiddleware, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_allowed_request_carries_rate_limit_headers() -> None:
+    response = await get(build_app(FixedLimiter(limited=False, used=1)), "/ping")
+    
+    assert response.status_code == 200
+    assert response.headers["x-ratelimit-limit"] == "100"
+    assert response.headers["x-ratelimit-remaining"] == "99"
+
+
+async def test_limited_request_is_rejected_with_429() -> None:
+    response = await get(build_app(FixedLimiter(limited=True, used=100)), "/ping")
+    
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Rate limit exceeded"}
+    assert response.headers["x-ratelimit-limit"] == "100"
+    assert response.headers["x-ratelimit-remaining"] == "0"
+
+
+async def test_excluded_path_is_not_limited() -> None:
+    response = await get(build_app(FixedLimiter(limited=True, used=100)), "/health")
+    
+    assert response.status_code == 200
+    assert "x-ratelimit-limit" not in response.headers
+
+
+async def test_redis_outage_lets_requests_through() -> None:
+    response = await get(build_app(UnreachableLimiter()), "/ping")
+    
+    assert response.status_code == 200
+    assert "x-ratelimit-limit" not in response.headers